@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from collections import defaultdict, deque
 from types import FunctionType
 from typing import Any, Callable, Iterable
 
@@ -9,66 +8,109 @@ EVENT_UNHANDLED = None
 
 EVENT_HANDLE_STATE = bool | None
 
+
+def _remove_newest(items: list, item: Any) -> None:
+    # Lists are stored oldest first, so the newest match is the last one.
+    for index in range(len(items) - 1, -1, -1):
+        if items[index] == item:
+            del items[index]
+            return
+    msg = f'{item!r} is not in list'
+    raise ValueError(msg)
+
+
 class EventDispatcher:
-    _events: defaultdict[str, deque[Callable]]
-    _event_dispatcher_handlers: deque[EventDispatcher | EventHandler]
-    _class_events: set[str] | None = None
+    # Functions and handlers are stored oldest first, and called newest first.
+    # Both containers are None until something is added to them.
+    _events: dict[str, list[Callable]] | None
+    _event_dispatcher_handlers: list[EventDispatcher | EventHandler] | None
+    # Event -> functions in call order. Entries are dropped when the event's functions change.
+    _dispatch_cache: dict[str, tuple[Callable, ...]] | None
+    # Shared with the parent class until the subclass registers its own events.
+    _class_events: frozenset[str] = frozenset()
+    # Class events with a method on the class to bind to each new instance.
+    _auto_bind_events: tuple[str, ...] = ()
     
     def __init_subclass__(cls):
-        cls._class_events = set()
+        events = frozenset()
         for parent in cls.__bases__:
-            try:
-                cls._class_events |= parent._class_events
-            except TypeError:
-                pass
-            except AttributeError:
-                pass
+            parent_events = getattr(parent, '_class_events', None)
+            if parent_events:
+                events = events | parent_events if events else parent_events
+        cls._class_events = events
+        cls._update_auto_bind_events()
         super().__init_subclass__()
     
     def __new__(cls, *args, **kwargs):
         instance = object.__new__(cls)
-        instance._events = defaultdict(deque)
-        instance._event_dispatcher_handlers = deque()
-        if cls._class_events:
-            for event in cls._class_events:
-                if hasattr(instance, event):
-                    func = getattr(instance, event)
-                    if getattr(func, 'event_using', True):
-                        instance._events[event].appendleft(func)
+        instance._event_dispatcher_handlers = None
+        if cls._auto_bind_events:
+            instance._events = {event: [getattr(instance, event)] for event in cls._auto_bind_events}
+            instance._dispatch_cache = {}
+        else:
+            instance._events = None
+            instance._dispatch_cache = None
         return instance
     
+    @classmethod
+    def _update_auto_bind_events(cls) -> None:
+        events = []
+        for event in cls._class_events:
+            func = getattr(cls, event, None)
+            if func is not None and getattr(func, 'event_using', True):
+                events.append(event)
+        cls._auto_bind_events = tuple(events)
+    
     @classmethod
     def register_event_type(cls, event: str) -> None:
-        try:
-            cls._class_events.add(event)
-        except AttributeError:
-            cls._class_events = {event}
+        cls._class_events = cls._class_events | {event}
+        cls._update_auto_bind_events()
+    
+    def _get_functions(self, event: str) -> list[Callable]:
+        # Get the event's function list for modification, creating it if needed.
+        if self._events is None:
+            self._events = {}
+            self._dispatch_cache = {}
+        else:
+            self._dispatch_cache.pop(event, None)
+        return self._events.setdefault(event, [])
     
     def add_event(self, event: str, func: Callable) -> None:
-        self._events[event].appendleft(func)
+        self._get_functions(event).append(func)
     
     def extend_event(self, event: str, func: Iterable[Callable]) -> None:
-        self._events[event].extendleft(func)
+        self._get_functions(event).extend(func)
     
     def event(self, func: FunctionType) -> FunctionType:
         self.add_event(func.__name__, func)
         return func
     
     def push_handler(self, handler: EventHandler | EventDispatcher) -> None:
-        self._event_dispatcher_handlers.appendleft(handler)
+        if self._event_dispatcher_handlers is None:
+            self._event_dispatcher_handlers = [handler]
+        else:
+            self._event_dispatcher_handlers.append(handler)
     
     def remove_handler(self, handler: EventHandler | EventDispatcher) -> None:
-        self._event_dispatcher_handlers.remove(handler)
+        _remove_newest(self._event_dispatcher_handlers or [], handler)
     
     def update_events(self, **functions: Callable) -> None:
         for event, func in functions.items():
             self.add_event(event, func)
     
-    def pop_event(self, event: str) -> Callable:
-        return self._events.get(event).popleft()
+    def pop_event(self, event: str) -> Callable | None:
+        functions = self._events.get(event) if self._events else None
+        if not functions:
+            return None
+        self._dispatch_cache.pop(event, None)
+        return functions.pop()
     
     def remove_event(self, event: str, func: Callable) -> None:
-        self._events[event].remove(func)
+        if self._events is None:
+            msg = f'{func!r} is not a function of event {event!r}'
+            raise ValueError(msg)
+        _remove_newest(self._events.get(event, []), func)
+        self._dispatch_cache.pop(event, None)
     
     def has_event(self, event: str) -> bool:
         if self._events:
@@ -81,22 +123,28 @@ class EventDispatcher:
         return set()
     
     def dispatch_event(self, event: str, *args, **kwargs) -> bool:
-        functions = self._events.get(event)
-        if functions:
+        events = self._events
+        if events is not None:
+            functions = self._dispatch_cache.get(event)
+            if functions is None:
+                functions = self._dispatch_cache[event] = tuple(reversed(events.get(event, ())))
             for func in functions:
                 if func(*args, **kwargs):
                     return True
         
-        if self._event_dispatcher_handlers:
-            for handler in self._event_dispatcher_handlers:
+        handlers = self._event_dispatcher_handlers
+        if handlers:
+            for handler in reversed(handlers):
                 if handler.dispatch_event(event, *args, **kwargs):
                     return True
         
         return False
     
     def to_dispatch_event(self, event: str) -> Callable:
+        dispatch_event = self.dispatch_event
+
         def func(*args, **kwargs):
-            return self.dispatch_event(event, *args, **kwargs)
+            return dispatch_event(event, *args, **kwargs)
         func.__name__ = event
         return func
 
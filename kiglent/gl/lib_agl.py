@@ -12,26 +12,35 @@ __all__ = ['link_GL', 'link_AGL']
 gl_lib = kiglent.lib.load_library(framework='OpenGL')
 agl_lib = kiglent.lib.load_library(framework='AGL')
 
+# Functions already linked, by name.
+_link_cache: dict[str, Callable[..., Any]] = {}
+
 
 def link_GL(name: str, restype: Any, argtypes: Any, requires: str | None = None,  # noqa: N802, D103
             suggestions: Sequence[str] | None = None) -> Callable[..., Any]:
-    try:
-        func = getattr(gl_lib, name)
+    func = _link_cache.get(name)
+    if func is not None:
+        return func
+    func = getattr(gl_lib, name, None)
+    if func is not None:
         func.restype = restype
         func.argtypes = argtypes
         decorate_function(func, name)
+        _link_cache[name] = func
         return func
-    except AttributeError:
-        return missing_function(name, requires, suggestions)
+    return missing_function(name, requires, suggestions)
 
 
 def link_AGL(name: str, restype: Any, argtypes: Any, requires: str | None = None,  # noqa: N802, D103
             suggestions: Sequence[str] | None = None) -> Callable[..., Any]:
-    try:
-        func = getattr(agl_lib, name)
+    func = _link_cache.get(name)
+    if func is not None:
+        return func
+    func = getattr(agl_lib, name, None)
+    if func is not None:
         func.restype = restype
         func.argtypes = argtypes
         decorate_function(func, name)
+        _link_cache[name] = func
         return func
-    except AttributeError:
-        return missing_function(name, requires, suggestions)
+    return missing_function(name, requires, suggestions)
@@ -20,6 +20,9 @@ try:
 except AttributeError:
     _have_getprocaddress = False
 
+# Functions already linked, by name.
+_link_cache: dict[str, Callable[..., Any]] = {}
+
 
 def link_GL(name: str, restype: Any, argtypes: Any, requires: str | None = None,  # noqa: N802
             suggestions: Sequence[str] | None = None) -> Callable[..., Any]:
@@ -29,22 +32,26 @@ def link_GL(name: str, restype: Any, argtypes: Any, requires: str | None = None,
 
     If both are unsuccessful, a dummy function will be returned that raises a MissingFunctionException.
     """
-    try:
-        func = getattr(gl_lib, name)
+    func = _link_cache.get(name)
+    if func is not None:
+        return func
+    func = getattr(gl_lib, name, None)
+    if func is not None:
         func.restype = restype
         func.argtypes = argtypes
         decorate_function(func, name)
+        _link_cache[name] = func
         return func
-    except AttributeError:
-        if _have_getprocaddress:
-            # Fallback if implemented but not in ABI
-            bname = cast(pointer(create_string_buffer(asbytes(name))), POINTER(c_ubyte))
-            addr = glXGetProcAddressARB(bname)
-            if addr:
-                ftype = CFUNCTYPE(*((restype, *tuple(argtypes))))
-                func = cast(addr, ftype)
-                decorate_function(func, name)
-                return func
+    if _have_getprocaddress:
+        # Fallback if implemented but not in ABI
+        bname = cast(pointer(create_string_buffer(asbytes(name))), POINTER(c_ubyte))
+        addr = glXGetProcAddressARB(bname)
+        if addr:
+            ftype = CFUNCTYPE(*((restype, *tuple(argtypes))))
+            func = cast(addr, ftype)
+            decorate_function(func, name)
+            _link_cache[name] = func
+            return func
 
     return missing_function(name, requires, suggestions)
 
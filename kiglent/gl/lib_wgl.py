@@ -31,6 +31,9 @@ except AttributeError:
 
 class_slots = ['name', 'requires', 'suggestions', 'ftype', 'func']
 
+# Functions already linked, by name.
+_link_cache: dict[str, Callable[..., Any]] = {}
+
 
 def makeWGLFunction(func: Callable) -> Callable:  # noqa: N802
     class WGLFunction:
@@ -72,33 +75,37 @@ class WGLFunctionProxy:
 
 def link_GL(name: str, restype: Any, argtypes: Any, requires: str | None = None,  # noqa: N802, D103
             suggestions: Sequence[str] | None = None) -> Callable[..., Any]:
-    try:
-        func = getattr(gl_lib, name)
+    func = _link_cache.get(name)
+    if func is not None:
+        return func
+    func = getattr(gl_lib, name, None)
+    if func is not None:
         func.restype = restype
         func.argtypes = argtypes
         decorate_function(func, name)
+        _link_cache[name] = func
         return func
-    except AttributeError:
-        # Not in opengl32.dll. Try and get a pointer from WGL.
-        try:
-            fargs = (restype,) + tuple(argtypes)
-            ftype = ctypes.WINFUNCTYPE(*fargs)
-            if _have_get_proc_address:
-                from kiglent.gl import gl_info
-                if gl_info.have_context():
-                    address = wglGetProcAddress(name)
-                    if address:
-                        func = cast(address, ftype)
-                        decorate_function(func, name)
-                        return func
-                else:
-                    # Insert proxy until we have a context
-                    return WGLFunctionProxy(name, ftype, requires, suggestions)
-        except:  # noqa: E722, S110
-            # TODO: Figure out what exception this can cause instead of catching all.
-            pass
-
-        return missing_function(name, requires, suggestions)
+    # Not in opengl32.dll. Try and get a pointer from WGL.
+    try:
+        fargs = (restype,) + tuple(argtypes)
+        ftype = ctypes.WINFUNCTYPE(*fargs)
+        if _have_get_proc_address:
+            from kiglent.gl import gl_info
+            if gl_info.have_context():
+                address = wglGetProcAddress(name)
+                if address:
+                    func = cast(address, ftype)
+                    decorate_function(func, name)
+                    _link_cache[name] = func
+                    return func
+            else:
+                # Insert proxy until we have a context
+                return WGLFunctionProxy(name, ftype, requires, suggestions)
+    except:  # noqa: E722, S110
+        # TODO: Figure out what exception this can cause instead of catching all.
+        pass
+
+    return missing_function(name, requires, suggestions)
 
 
 link_WGL = link_GL  # noqa: N816
@@ -9,6 +9,7 @@ See the :ref:`guide_graphics` for details on how to use this graphics API.
 from __future__ import annotations
 
 import ctypes
+from operator import attrgetter
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Sequence, Tuple
 
 import kiglent
@@ -38,6 +39,16 @@ if TYPE_CHECKING:
 
 _debug_graphics_batch = kiglent.options['debug_graphics_batch']
 
+_group_sort_key = attrgetter('_sort_key')
+
+
+def _sort_groups(groups: list[Group]) -> None:
+    # Sort by the cached state key, unless a group defines its own ordering.
+    if all(type(group).__lt__ is Group.__lt__ for group in groups):
+        groups.sort(key=_group_sort_key, reverse=True)
+    else:
+        groups.sort(reverse=True)
+
 
 def draw(size: int, mode: int, **data: Any) -> None:
     """Draw a primitive immediately.
@@ -467,40 +478,48 @@ class Batch:
                 self.group_children[group.parent] = []
             self.group_children[group.parent].append(group)
 
-        group._assigned_batches.add(self)  # noqa: SLF001
+        group._assigned_batches[id(self)] = self  # noqa: SLF001
         self._draw_list_dirty = True
 
     def _update_draw_list(self) -> None:
         """Visit group tree in preorder and create a list of bound methods to call."""
         
-        self.top_groups.sort(reverse=True)
+        _sort_groups(self.top_groups)
 
         draw_list = []
         stack = [(group, False) for group in self.top_groups if group.visible]
+        # The group whose unset_state was last appended, while it is still the last entry.
+        last_unset = None
 
         while stack:
             group, unset = stack.pop()
             if unset:
                 draw_list.append(group.unset_state)
+                last_unset = group
             else:
                 domain_map = self.group_map[group]
                 children = self.group_children.get(group)
                 
                 if domain_map or children:
-                    draw_list.append(group.set_state)
+                    if last_unset is not None and last_unset.is_compatible_with(group):
+                        # The previous sibling's state is still valid: drop its unset and skip this set.
+                        draw_list.pop()
+                    else:
+                        draw_list.append(group.set_state)
+                    last_unset = None
                     stack.append((group, True))
                 else:
                     continue 
                 
                 if domain_map:
-                    for (indexed, instanced, mode, formats), domain in domain_map.items():
+                    for (indexed, instanced, mode, formats), domain in list(domain_map.items()):
                         if domain.is_empty:
                             del domain_map[(indexed, instanced, mode, formats)]
                             continue
                         draw_list.append((lambda d, m: lambda: d.draw(m))(domain, mode))
                 
                 if children:
-                    children.sort(reverse = True)
+                    _sort_groups(children)
                     stack.extend((child, False) for child in children if child.visible)
         
         self._draw_list = draw_list
@@ -538,6 +557,8 @@ class Batch:
         if self._draw_list_dirty:
             self._update_draw_list()
 
+        invalidate_state_cache()
+
         for func in self._draw_list:
             func()
 
@@ -556,22 +577,32 @@ class Batch:
                 Vertex lists to draw.
 
         """
+        invalidate_state_cache()
+
+        _sort_groups(self.top_groups)
         
-        
-        self.top_groups.sort()
-        
-        stack = [group for group in self.top_groups if group.visible]
+        stack = [(group, False) for group in self.top_groups if group.visible]
+        # A group's unset_state is held back until the next group is known not to be compatible with it.
+        pending_unset = None
         
         while stack:
             group, unset = stack.pop()
             if unset:
-                group.unset_state()
+                if pending_unset is not None:
+                    pending_unset.unset_state()
+                pending_unset = group
             else:
                 domain_map = self.group_map[group]
                 children = self.group_children.get(group)
                 
                 if domain_map or children:
-                    group.set_state()
+                    if pending_unset is None:
+                        group.set_state()
+                    elif not pending_unset.is_compatible_with(group):
+                        pending_unset.unset_state()
+                        group.set_state()
+                    pending_unset = None
+                    stack.append((group, True))
                 else:
                     continue 
                 
@@ -582,8 +613,11 @@ class Batch:
                                 alist.draw(mode)
                 
                 if children:
-                    children.sort(reverse = True)
-                    stack.extend(child for child in children if child.visible)
+                    _sort_groups(children)
+                    stack.extend((child, False) for child in children if child.visible)
+
+        if pending_unset is not None:
+            pending_unset.unset_state()
 
 
 from kiglent.graphics.groups import *
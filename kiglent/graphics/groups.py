@@ -2,17 +2,63 @@ from __future__ import annotations
 
 import weakref
 import math as _math
-from typing import TYPE_CHECKING
+from ctypes import c_float
+from typing import TYPE_CHECKING, ClassVar
 
 from kiglent import window as _window
-from kiglent.vector import Vec3
+from kiglent.gl.gl import GL_TEXTURE0, glActiveTexture, glBindTexture
+from kiglent.graphics import shader as _shader
 from kiglent.matrix import Mat4
 
 if TYPE_CHECKING:
+    from ctypes import Array
+
     from kiglent.graphics import Batch
+    from kiglent.graphics.shader import ShaderProgram
+
+
+__all__ = ['Group', 'ShaderGroup', 'TextureGroup', 'TranslationGroup', 'ScaleGroup', 'RotationGroup',
+           'bind_texture', 'invalidate_state_cache']
+
+# Texture unit last made active, or None if unknown.
+_active_texture_unit: int | None = None
+# Texture target -> name last bound on ``GL_TEXTURE0``.
+_bound_textures: dict[int, int] = {}
+
+
+def invalidate_state_cache() -> None:
+    """Forget the OpenGL state cached by the groups in this module.
+
+    Groups skip redundant state changes by remembering the program, active
+    texture unit and textures they last bound. Call this after changing that
+    state directly with OpenGL, so the next group to need it binds it again.
+    ``Batch.draw`` calls this before drawing, and ``Texture`` calls it after
+    binding or deleting a texture itself.
+    """
+    global _active_texture_unit  # noqa: PLW0603
+    _shader._bound_program_id = None  # noqa: SLF001
+    _active_texture_unit = None
+    _bound_textures.clear()
+
 
+def _bind_program(program: ShaderProgram) -> None:
+    if _shader._bound_program_id != program._id:  # noqa: SLF001
+        program.use()
 
-__all__ = ['Group', 'ShaderGroup', 'TextureGroup', 'TranslationGroup', 'ScaleGroup', 'RotationGroup']
+
+def bind_texture(target: int, tex_id: int) -> None:
+    """Bind a texture on texture unit 0, unless it is already bound there.
+
+    Use this in ``set_state`` of custom groups instead of binding the texture
+    directly, so that it shares the cache of the groups in this module.
+    """
+    global _active_texture_unit  # noqa: PLW0603
+    if _active_texture_unit != GL_TEXTURE0:
+        glActiveTexture(GL_TEXTURE0)
+        _active_texture_unit = GL_TEXTURE0
+    if _bound_textures.get(target) != tex_id:
+        glBindTexture(target, tex_id)
+        _bound_textures[target] = tex_id
 
 
 class Group:
@@ -38,6 +84,13 @@ class Group:
             batch.draw()
     """
 
+    __slots__ = ('__weakref__', '_ancestry', '_ancestry_epoch', '_assigned_batches', '_hash', '_key', '_order',
+                 '_parent', '_sort_key', '_visible')
+
+    # Incremented whenever any group's parent is reassigned, which also changes
+    # the ancestry of that group's descendants.
+    _parent_epoch: ClassVar[int] = 0
+
     def __init__(self, order: int = 0, parent: Group | None = None) -> None:
         """Initialize a rendering group.
 
@@ -49,9 +102,31 @@ class Group:
                 Group to contain this Group; its state will be set before this Group's state.
         """
         self._order = order
-        self.parent = parent
+        self._parent = parent
         self._visible = True
-        self._assigned_batches = weakref.WeakSet()
+        # Batches by id, so membership needs neither hashing nor comparing them.
+        self._assigned_batches = weakref.WeakValueDictionary()
+        self._key = (order, parent)
+        self._hash = hash(self._key)
+        self._sort_key = (order, 0, 0, 0)
+        # This group and its parents, outermost first.
+        self._ancestry = (self,) if parent is None else (*parent._get_ancestry(), self)
+        self._ancestry_epoch = Group._parent_epoch
+
+    @property
+    def parent(self) -> Group | None:
+        """Group containing this Group; its state is set before this Group's state.
+
+        Reassigning it changes this group's ``__eq__`` and ``__hash__``, so do
+        so before adding the group to a Batch.
+        """
+        return self._parent
+
+    @parent.setter
+    def parent(self, parent: Group | None) -> None:
+        self._parent = parent
+        Group._parent_epoch += 1
+        self._update_key()
 
     @property
     def order(self) -> int:
@@ -73,10 +148,11 @@ class Group:
 
     @visible.setter
     def visible(self, value: bool) -> None:
-        self._visible = value
-
-        for batch in self._assigned_batches:
-            batch.invalidate()
+        if value != self._visible:
+            self._visible = value
+            # Only the batches drawing this group need to rebuild their draw lists.
+            for batch in self._assigned_batches.values():
+                batch.invalidate()
 
     @property
     def batches(self) -> tuple[Batch, ...]:
@@ -84,23 +160,49 @@ class Group:
 
         Read Only.
         """
-        return tuple(self._assigned_batches)
+        return tuple(self._assigned_batches.values())
 
     def __lt__(self, other: Group) -> bool:
         return self._order < other.order
 
+    def sort_key(self) -> tuple[int, int, int, int]:
+        """Key used by ``Batch`` to sort sibling groups.
+
+        Groups are sorted by ``order`` first, then by the state they set, so
+        that groups sharing a program or texture are drawn next to each other.
+        Groups with equal keys keep the order they were added to the batch in.
+        The key is computed once in ``__init__`` and stored in ``_sort_key``.
+
+        If a subclass overrides ``__lt__``, ``Batch`` sorts its siblings with
+        ``__lt__`` instead of this key.
+
+        Returns:
+            A tuple of (``order``, program name, texture target, texture name).
+        """
+        return self._order, 0, 0, 0
+
+    def _make_key(self) -> tuple:
+        # The identifiers compared by ``__eq__`` and hashed by ``__hash__``.
+        return self._order, self._parent
+
+    def _update_key(self) -> None:
+        # Subclasses that override ``_make_key`` call this at the end of ``__init__``.
+        self._key = self._make_key()
+        self._hash = hash(self._key)
+        self._sort_key = self.sort_key()
+
     def __eq__(self, other: Group) -> bool:
         """Comparison function used to determine if another Group is providing the same state.
 
         When the same state is determined, those groups will be consolidated into one draw call.
 
         If subclassing, then care must be taken to ensure this function can compare to another of the same group.
+        Subclasses can instead return a tuple of their unique identifiers from ``_make_key``, and call
+        ``_update_key`` at the end of ``__init__`` to store it in ``_key``.
 
         :see: ``__hash__`` function, both must be implemented.
         """
-        return (self.__class__ is other.__class__ and
-                self._order == other.order and
-                self.parent == other.parent)
+        return self.__class__ is other.__class__ and self._key == other._key
 
     def __hash__(self) -> int:
         """This is an immutable return to establish the permanent identity of the object.
@@ -109,11 +211,12 @@ class Group:
 
         For simplicity, the hash should be a tuple containing your unique identifiers of your Group.
 
-        By default, this is (``order``, ``parent``).
+        By default, this is the hash of ``_key``, (``order``, ``parent``). It is computed once in ``__init__``,
+        and again when ``parent`` is reassigned.
 
         :see: ``__eq__`` function, both must be implemented.
         """
-        return hash((self._order, self.parent))
+        return self._hash
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(order={self._order})"
@@ -130,6 +233,24 @@ class Group:
         The default implementation does nothing.
         """
 
+    def is_compatible_with(self, other: Group) -> bool:
+        """Whether this group's state can be kept in place of another's.
+
+        ``Batch`` only calls ``unset_state`` and ``set_state`` between two
+        consecutive sibling groups when they are not compatible, so a run of
+        compatible groups sets its state once. By default, groups are
+        compatible if they have equivalent state.
+        """
+        return self.equivalent_state(other)
+
+    def equivalent_state(self, other: Group | None) -> bool:
+        """Whether another group sets exactly the same state as this one.
+
+        This is ``==``, so subclasses that override ``__eq__`` are compared by
+        their own state rather than by the inherited ``_key``.
+        """
+        return other is not None and self == other
+
     def set_state_recursive(self) -> None:
         """Set this group and its ancestry.
 
@@ -137,41 +258,52 @@ class Group:
         parent groups will be called in top-down order, with this class's
         ``set`` being called last.
         """
-        if self.parent:
-            self.parent.set_state_recursive()
-        self.set_state()
+        for group in self._get_ancestry():
+            group.set_state()
 
     def unset_state_recursive(self) -> None:
         """Unset this group and its ancestry.
 
         The inverse of ``set_state_recursive``.
         """
-        self.unset_state()
-        if self.parent:
-            self.parent.unset_state_recursive()
+        for group in reversed(self._get_ancestry()):
+            group.unset_state()
+
+    def _get_ancestry(self) -> tuple[Group, ...]:
+        # Rebuilt if any group's parent was reassigned since it was last built.
+        if self._ancestry_epoch != Group._parent_epoch:
+            parent = self._parent
+            self._ancestry = (self,) if parent is None else (*parent._get_ancestry(), self)
+            self._ancestry_epoch = Group._parent_epoch
+        return self._ancestry
 
 
 class ShaderGroup(Group):
-    """A group that enables and binds a ShaderProgram."""
+    """A group that enables and binds a ShaderProgram.
+
+    The program is left bound when the group is unset, so a run of groups
+    sharing one program only binds it once.
+    """
+
+    __slots__ = ('program',)
 
     def __init__(self, program: ShaderProgram, order: int = 0, parent: Group | None = None) -> None:  # noqa: D107
         super().__init__(order, parent)
         self.program = program
+        self._update_key()
 
     def set_state(self) -> None:
-        self.program.use()
+        _bind_program(self.program)
 
     def unset_state(self) -> None:
-        self.program.stop()
+        # The next group to need a different program will bind it.
+        pass
 
-    def __eq__(self, other: ShaderGroup) -> bool:
-        return (self.__class__ is other.__class__ and
-                self._order == other.order and
-                self.program == other.program and
-                self.parent == other.parent)
+    def sort_key(self) -> tuple[int, int, int, int]:
+        return self._order, self.program.id, 0, 0
 
-    def __hash__(self) -> int:
-        return hash((self._order, self.parent, self.program))
+    def _make_key(self) -> tuple:
+        return self._order, self._parent, self.program
 
 
 class TextureGroup(Group):
@@ -180,6 +312,8 @@ class TextureGroup(Group):
     TextureGroups are equal if their textures' targets and names are equal.
     """
 
+    __slots__ = ('texture',)
+
     def __init__(self, texture: kiglent.image.Texture, order: int = 0, parent: Group | None = None) -> None:
         """Create a texture group.
 
@@ -193,32 +327,48 @@ class TextureGroup(Group):
         """
         super().__init__(order, parent)
         self.texture = texture
+        self._update_key()
 
     def set_state(self) -> None:
-        glActiveTexture(GL_TEXTURE0)
-        glBindTexture(self.texture.target, self.texture.id)
-
-    def __hash__(self) -> int:
-        return hash((self.texture.target, self.texture.id, self.order, self.parent))
-
-    def __eq__(self, other: TextureGroup) -> bool:
-        return (self.__class__ is other.__class__ and
+        bind_texture(self.texture.target, self.texture.id)
+
+    def is_compatible_with(self, other: Group) -> bool:
+        # Plain TextureGroups binding the same texture are compatible regardless of their order.
+        # Subclasses may set more state, so they are only compatible if they are equal.
+        if type(self) is not TextureGroup:
+            return self.equivalent_state(other)
+        return (other.__class__ is TextureGroup and
                 self.texture.target == other.texture.target and
                 self.texture.id == other.texture.id and
-                self.order == other.order and
                 self.parent == other.parent)
 
+    def sort_key(self) -> tuple[int, int, int, int]:
+        # Sort by the program of the nearest ShaderGroup ancestor before the texture.
+        parent = self.parent
+        while parent is not None and not isinstance(parent, ShaderGroup):
+            parent = parent.parent
+        program_key = 0 if parent is None else parent.program.id
+        return self._order, program_key, self.texture.target, self.texture.id
+
+    def _make_key(self) -> tuple:
+        return self.texture.target, self.texture.id, self._order, self._parent
+
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}(order={self._order}, id={self.texture.id})'
 
 
 class TranslationGroup(Group):
+    __slots__ = '_cached_matrix', '_cached_projection', '_projection', '_vec3', '_x', '_y', 'window'
+
     window: _window.BaseWindow
     
-    _x: float = 0.0
-    _y: float = 0.0
-    _vec3: tuple[float, float, float] | Vec3
+    _x: float
+    _y: float
+    _vec3: Array[c_float]
     _projection: Mat4
+    # The translated matrix, and the projection it was computed from.
+    _cached_matrix: Mat4 | None
+    _cached_projection: Mat4 | None
     def __init__(self,
                  order: int = 0, parent: Group | None = None,
                  x: float = 0.0, y: float = 0.0,
@@ -226,11 +376,17 @@ class TranslationGroup(Group):
         super().__init__(order, parent)
         self._x = x
         self._y = y
-        self._vec3 = (x, y, 0.0)
+        self._vec3 = (c_float * 3)(x, y, 0.0)
         if window is None:
             window = _window.get_current_window()
         self.window = window
         self._projection = window.projection
+        self._cached_matrix = None
+        self._cached_projection = None
+        self._update_key()
+
+    def _make_key(self) -> tuple:
+        return self._order, self._parent, self.window
 
     @property
     def x(self) -> float:
@@ -238,7 +394,8 @@ class TranslationGroup(Group):
     @x.setter
     def x(self, x: float) -> None:
         self._x = x
-        self._vec3 = (x, self._y, 0.0)
+        self._vec3[0] = x
+        self._cached_projection = None
 
     @property
     def y(self) -> float:
@@ -246,32 +403,32 @@ class TranslationGroup(Group):
     @y.setter
     def y(self, y: float) -> None:
         self._y = y
-        self._vec3 = (self._x, y, 0.0)
+        self._vec3[1] = y
+        self._cached_projection = None
 
     def set_state(self) -> None:
         projection = self.window.projection
         self._projection = projection
-        self.window.projection = projection.translate(self._vec3)
+        if projection is not self._cached_projection:
+            self._cached_matrix = projection.translate(self._vec3)
+            self._cached_projection = projection
+        self.window.projection = self._cached_matrix
 
     def unset_state(self) -> None:
         self.window.projection = self._projection
-
-    def __eq__(self, other: TranslationGroup) -> bool:
-        return (self.__class__ is other.__class__ and
-                self._order == other.order and
-                self.window == other.window and
-                self.parent == other.parent)
-
-    def __hash__(self) -> int:
-        return hash((self._order, self.parent, self.window))
     
 class ScaleGroup(Group):
+    __slots__ = '_cached_matrix', '_cached_projection', '_projection', '_scale_x', '_scale_y', '_vec3', 'window'
+
     window: _window.BaseWindow
     
-    _scale_x: float = 0.0
-    _scale_y: float = 0.0
-    _vec3: tuple[float, float, float] | Vec3
+    _scale_x: float
+    _scale_y: float
+    _vec3: Array[c_float]
     _projection: Mat4
+    # The scaled matrix, and the projection it was computed from.
+    _cached_matrix: Mat4 | None
+    _cached_projection: Mat4 | None
     def __init__(self,
                  order: int = 0, parent: Group | None = None,
                  scale_x: float = 1.0, scale_y: float = 1.0,
@@ -279,11 +436,17 @@ class ScaleGroup(Group):
         super().__init__(order, parent)
         self._scale_x = scale_x
         self._scale_y = scale_y
-        self._vec3 = (scale_x, scale_y, 1.0)
+        self._vec3 = (c_float * 3)(scale_x, scale_y, 1.0)
         if window is None:
             window = _window.get_current_window()
         self.window = window
         self._projection = window.projection
+        self._cached_matrix = None
+        self._cached_projection = None
+        self._update_key()
+
+    def _make_key(self) -> tuple:
+        return self._order, self._parent, self.window
 
     @property
     def scale_x(self) -> float:
@@ -291,7 +454,8 @@ class ScaleGroup(Group):
     @scale_x.setter
     def scale_x(self, scale_x: float) -> None:
         self._scale_x = scale_x
-        self._vec3 = (scale_x, self._scale_y, 1.0)
+        self._vec3[0] = scale_x
+        self._cached_projection = None
 
     @property
     def scale_y(self) -> float:
@@ -299,31 +463,31 @@ class ScaleGroup(Group):
     @scale_y.setter
     def scale_y(self, scale_y: float) -> None:
         self._scale_y = scale_y
-        self._vec3 = (self._scale_x, scale_y, 1.0)
+        self._vec3[1] = scale_y
+        self._cached_projection = None
 
     def set_state(self) -> None:
         projection = self.window.projection
         self._projection = projection
-        self.window.projection = projection.scale(self._vec3)
+        if projection is not self._cached_projection:
+            self._cached_matrix = projection.scale(self._vec3)
+            self._cached_projection = projection
+        self.window.projection = self._cached_matrix
 
     def unset_state(self) -> None:
         self.window.projection = self._projection
 
-    def __eq__(self, other: TranslationGroup) -> bool:
-        return (self.__class__ is other.__class__ and
-                self._order == other.order and
-                self.window == other.window and
-                self.parent == other.parent)
-
-    def __hash__(self) -> int:
-        return hash((self._order, self.parent, self.window))
-
 
 class RotationGroup(Group):
+    __slots__ = '_cached_matrix', '_cached_projection', '_projection', '_rotation', 'window'
+
     window: _window.BaseWindow
     
-    _rotation: float = 0.0
+    _rotation: float
     _projection: Mat4
+    # The rotated matrix, and the projection it was computed from.
+    _cached_matrix: Mat4 | None
+    _cached_projection: Mat4 | None
     def __init__(self,
                  order: int = 0, parent: Group | None = None,
                  rotation: float = 0.0,
@@ -334,6 +498,12 @@ class RotationGroup(Group):
             window = _window.get_current_window()
         self.window = window
         self._projection = window.projection
+        self._cached_matrix = None
+        self._cached_projection = None
+        self._update_key()
+
+    def _make_key(self) -> tuple:
+        return self._order, self._parent, self.window
 
     @property
     def rotation(self) -> float:
@@ -341,22 +511,17 @@ class RotationGroup(Group):
     @rotation.setter
     def rotation(self, rotation: float) -> None:
         self._rotation = rotation
+        self._cached_projection = None
 
     def set_state(self) -> None:
         projection = self.window.projection
         self._projection = projection
-        self.window.projection = projection.rotate_z(self._rotation)
+        if projection is not self._cached_projection:
+            self._cached_matrix = projection.rotate_z(self._rotation)
+            self._cached_projection = projection
+        self.window.projection = self._cached_matrix
 
     def unset_state(self) -> None:
         self.window.projection = self._projection
 
-    def __eq__(self, other: TranslationGroup) -> bool:
-        return (self.__class__ is other.__class__ and
-                self._order == other.order and
-                self.window == other.window and
-                self.parent == other.parent)
-
-    def __hash__(self) -> int:
-        return hash((self._order, self.parent, self.window))
-
 
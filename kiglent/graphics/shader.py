@@ -71,6 +71,15 @@ if TYPE_CHECKING:
 
 _debug_gl_shaders = kiglent.options['debug_gl_shaders']
 
+# Program most recently bound with glUseProgram, or None if unknown.
+_bound_program_id: int | None = None
+
+
+def _use_program(program_id: int) -> None:
+    global _bound_program_id  # noqa: PLW0603
+    glUseProgram(program_id)
+    _bound_program_id = program_id
+
 
 class ShaderException(BaseException):  # noqa: D101
     pass
@@ -458,7 +467,7 @@ class _UniformArray:
             else:
                 self._gl_setter(self._uniform.program, location, size, data)
         else:
-            glUseProgram(self._uniform.program)
+            _use_program(self._uniform.program)
             if self._is_matrix:
                 self._gl_setter(location, size, GL_FALSE, data)
             else:
@@ -535,12 +544,20 @@ class _Uniform:
     def _create_setter_func(program_id: int, location: int, gl_setter: GLFunc, c_array: Array[GLDataType], length: int,
                             ptr: CTypesPointer[GLDataType], is_matrix: bool, dsa: bool) -> Callable[[float], None]:
         """Factory function for creating simplified Uniform setters."""
+        # The last matrix uploaded, if it was a tuple. Tuples (such as Mat4) are
+        # immutable, so setting the same one again doesn't need another upload.
+        last_matrix = None
+
         if dsa:  # Bindless updates:
 
             if is_matrix:
                 def setter_func(value: float) -> None:
+                    nonlocal last_matrix
+                    if value is last_matrix:
+                        return
                     c_array[:] = value
                     gl_setter(program_id, location, 1, GL_FALSE, ptr)
+                    last_matrix = value if isinstance(value, tuple) else None
             elif length == 1:
                 def setter_func(value: float) -> None:
                     c_array[0] = value
@@ -558,17 +575,21 @@ class _Uniform:
 
         if is_matrix:
             def setter_func(value: float) -> None:
-                glUseProgram(program_id)
+                nonlocal last_matrix
+                _use_program(program_id)
+                if value is last_matrix:
+                    return
                 c_array[:] = value
                 gl_setter(location, 1, GL_FALSE, ptr)
+                last_matrix = value if isinstance(value, tuple) else None
         elif length == 1:
             def setter_func(value: float) -> None:
-                glUseProgram(program_id)
+                _use_program(program_id)
                 c_array[0] = value
                 gl_setter(location, 1, ptr)
         elif length > 1:
             def setter_func(values: float) -> None:
-                glUseProgram(program_id)
+                _use_program(program_id)
                 c_array[:] = values
                 gl_setter(location, 1, ptr)
         else:
@@ -1351,18 +1372,18 @@ class ShaderProgram:
         return self._uniform_blocks
 
     def use(self) -> None:
-        glUseProgram(self._id)
+        _use_program(self._id)
 
     @staticmethod
     def stop() -> None:
-        glUseProgram(0)
+        _use_program(0)
 
     __enter__ = use
     bind = use
     unbind = stop
 
     def __exit__(self, *_) -> None:  # noqa: ANN002
-        glUseProgram(0)
+        _use_program(0)
 
     def delete(self) -> None:
         glDeleteProgram(self._id)
@@ -1599,18 +1620,18 @@ class ComputeShaderProgram:
         return self._uniform_blocks
 
     def use(self) -> None:
-        glUseProgram(self._id)
+        _use_program(self._id)
 
     @staticmethod
     def stop() -> None:
-        glUseProgram(0)
+        _use_program(0)
 
     __enter__ = use
     bind = use
     unbind = stop
 
     def __exit__(self, *_) -> None:  # noqa: ANN002
-        glUseProgram(0)
+        _use_program(0)
 
     def delete(self) -> None:
         glDeleteProgram(self._id)
@@ -118,6 +118,7 @@ from kiglent.gl import (
     glGetIntegerv, glGetTexImage, glPixelStorei, glReadBuffer, glReadPixels, glTexImage2D, glTexImage3D,
     glTexParameteri, glTexSubImage2D, glTexSubImage3D, gl_info
 )
+from kiglent.graphics import groups as _groups
 from kiglent.graphics.shader import Attribute
 from kiglent.graphics.vertexbuffer import BufferObject
 from kiglent.util import asbytes
@@ -146,6 +147,12 @@ class TextureArrayDepthExceeded(ImageException):
     """Exception occurs when depth has hit the maximum supported of the array."""
 
 
+def _bind_texture_directly(target: int, tex_id: int) -> None:
+    # Bound on whichever texture unit is active, behind the back of the groups' state cache.
+    glBindTexture(target, tex_id)
+    _groups.invalidate_state_cache()
+
+
 def load(filename: str, file: BinaryIO | None = None, decoder: ImageDecoder | None = None) -> AbstractImage:
     """Load an image from a file on disk, or from an open file-like object.
 
@@ -667,7 +674,7 @@ class ImageData(AbstractImage):
 
         internalformat = self._get_internalformat(self.format)
 
-        glBindTexture(texture.target, texture.id)
+        _bind_texture_directly(texture.target, texture.id)
         glTexParameteri(texture.target, GL_TEXTURE_MIN_FILTER, GL_LINEAR_MIPMAP_LINEAR)
 
         if self.mipmap_images:
@@ -1023,7 +1030,7 @@ class CompressedImageData(AbstractImage):
             texture.anchor_x = self.anchor_x
             texture.anchor_y = self.anchor_y
 
-        glBindTexture(texture.target, texture.id)
+        _bind_texture_directly(texture.target, texture.id)
         glTexParameteri(texture.target, GL_TEXTURE_MIN_FILTER, texture.min_filter)
         glTexParameteri(texture.target, GL_TEXTURE_MAG_FILTER, texture.mag_filter)
 
@@ -1060,7 +1067,7 @@ class CompressedImageData(AbstractImage):
             texture.anchor_x = self.anchor_x
             texture.anchor_y = self.anchor_y
 
-        glBindTexture(texture.target, texture.id)
+        _bind_texture_directly(texture.target, texture.id)
 
         glTexParameteri(texture.target, GL_TEXTURE_MIN_FILTER, GL_LINEAR_MIPMAP_LINEAR)
 
@@ -1183,19 +1190,22 @@ class Texture(AbstractImage):
         """
         glDeleteTextures(1, GLuint(self.id))
         self.id = None
+        # The name may be reused by a new texture, so it must not look bound.
+        _groups.invalidate_state_cache()
 
     def __del__(self):
         if self.id is not None:
             try:
                 self._context.delete_texture(self.id)
                 self.id = None
+                _groups.invalidate_state_cache()
             except (AttributeError, ImportError):
                 pass  # Interpreter is shutting down
 
     def bind(self, texture_unit: int = 0) -> None:
         """Bind to a specific Texture Unit by number."""
         glActiveTexture(GL_TEXTURE0 + texture_unit)
-        glBindTexture(self.target, self.id)
+        _bind_texture_directly(self.target, self.id)
 
     def bind_image_texture(self, unit: int, level: int = 0, layered: bool = False,
                            layer: int = 0, access: int = GL_READ_WRITE, fmt: int = GL_RGBA32F):
@@ -1241,7 +1251,7 @@ class Texture(AbstractImage):
 
         tex_id = GLuint()
         glGenTextures(1, byref(tex_id))
-        glBindTexture(target, tex_id.value)
+        _bind_texture_directly(target, tex_id.value)
         glTexParameteri(target, GL_TEXTURE_MIN_FILTER, min_filter)
         glTexParameteri(target, GL_TEXTURE_MAG_FILTER, mag_filter)
 
@@ -1272,7 +1282,7 @@ class Texture(AbstractImage):
             z:
                 For 3D textures, the image slice to retrieve.
         """
-        glBindTexture(self.target, self.id)
+        _bind_texture_directly(self.target, self.id)
 
         # Always extract complete RGBA data.  Could check internalformat
         # to only extract used channels. XXX
@@ -1325,7 +1335,7 @@ class Texture(AbstractImage):
         indices = [0, 1, 2, 0, 2, 3]
 
         glActiveTexture(GL_TEXTURE0)
-        glBindTexture(self.target, self.id)
+        _bind_texture_directly(self.target, self.id)
 
         # Create and bind a throwaway VAO
         vao_id = GLuint()
@@ -1375,7 +1385,7 @@ class Texture(AbstractImage):
         raise NotImplementedError(f"Not implemented for {self}.")
 
     def blit_into(self, source: AbstractImage, x: int, y: int, z: int):
-        glBindTexture(self.target, self.id)
+        _bind_texture_directly(self.target, self.id)
         source.blit_to_texture(self.target, self.level, x, y, z)
 
     def blit_to_texture(self, target: int, level: int, x: int, y: int, z: int, internalformat: int = None):
@@ -1533,7 +1543,7 @@ class Texture3D(Texture, UniformTextureSequence):
         texture.images = len(images)
 
         blank = (GLubyte * (texture.width * texture.height * texture.images * 4))() if blank_data else None
-        glBindTexture(texture.target, texture.id)
+        _bind_texture_directly(texture.target, texture.id)
         glTexImage3D(texture.target, texture.level,
                      internalformat,
                      texture.width, texture.height, texture.images, 0,
@@ -1565,7 +1575,7 @@ class Texture3D(Texture, UniformTextureSequence):
 
     def __setitem__(self, index, value):
         if type(index) is slice:
-            glBindTexture(self.target, self.id)
+            _bind_texture_directly(self.target, self.id)
 
             for item, image in zip(self[index], value):
                 image.blit_to_texture(self.target, self.level, image.anchor_x, image.anchor_y, item.z)
@@ -1621,7 +1631,7 @@ class TextureArray(Texture, UniformTextureSequence):
 
         tex_id = GLuint()
         glGenTextures(1, byref(tex_id))
-        glBindTexture(GL_TEXTURE_2D_ARRAY, tex_id.value)
+        _bind_texture_directly(GL_TEXTURE_2D_ARRAY, tex_id.value)
         glTexParameteri(GL_TEXTURE_2D_ARRAY, GL_TEXTURE_MIN_FILTER, min_filter)
         glTexParameteri(GL_TEXTURE_2D_ARRAY, GL_TEXTURE_MAG_FILTER, mag_filter)
 
@@ -1662,7 +1672,7 @@ class TextureArray(Texture, UniformTextureSequence):
         if len(self.items) + len(images) > self.max_depth:
             raise TextureArrayDepthExceeded("The amount of images being added exceeds the depth of this TextureArray.")
 
-        glBindTexture(self.target, self.id)
+        _bind_texture_directly(self.target, self.id)
 
         start_length = len(self.items)
         for i, image in enumerate(images):
@@ -1687,7 +1697,7 @@ class TextureArray(Texture, UniformTextureSequence):
 
     def __setitem__(self, index, value) -> None:
         if type(index) is slice:
-            glBindTexture(self.target, self.id)
+            _bind_texture_directly(self.target, self.id)
 
             for old_item, image in zip(self[index], value):
                 self._verify_size(image)
@@ -1741,11 +1751,11 @@ class TileableTexture(Texture):
                       u1, v2, t[11])
 
         glActiveTexture(GL_TEXTURE0)
-        glBindTexture(self.target, self.id)
+        _bind_texture_directly(self.target, self.id)
         kiglent.graphics.draw_indexed(4, GL_TRIANGLES, [0, 1, 2, 0, 2, 3],
                                      position=('f', vertices),
                                      tex_coords=('f', tex_coords))
-        glBindTexture(self.target, 0)
+        _bind_texture_directly(self.target, 0)
 
     @classmethod
     def create_for_image(cls, image: AbstractImage) -> Texture:
@@ -8,6 +8,7 @@ import ctypes
 
 from kiglent.gl import *
 from kiglent.gl import gl_info
+from kiglent.graphics.groups import invalidate_state_cache
 from kiglent.image import AbstractImage, Texture
 
 split_8byte = re.compile('.' * 8, flags=re.DOTALL)
@@ -42,6 +43,7 @@ class PackedImageData(AbstractImage):
 
         texture = Texture.create(self.width, self.height, GL_TEXTURE_2D, None)
         glBindTexture(texture.target, texture.id)
+        invalidate_state_cache()
         glTexParameteri(texture.target, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
 
         if not gl_info.have_version(1, 2) or True:
@@ -13,19 +13,26 @@ eglGetProcAddress = getattr(egl_lib, 'eglGetProcAddress')
 eglGetProcAddress.restype = POINTER(CFUNCTYPE(None))
 eglGetProcAddress.argtypes = [POINTER(c_ubyte)]
 
+# Functions already linked, by name.
+_link_cache = {}
+
 
 def link_EGL(name, restype, argtypes, requires=None, suggestions=None):
-    try:
-        func = getattr(egl_lib, name)
+    func = _link_cache.get(name)
+    if func is not None:
+        return func
+    func = getattr(egl_lib, name, None)
+    if func is not None:
         func.restype = restype
         func.argtypes = argtypes
+        _link_cache[name] = func
+        return func
+    bname = cast(pointer(create_string_buffer(kiglent.util.asbytes(name))), POINTER(c_ubyte))
+    addr = eglGetProcAddress(bname)
+    if addr:
+        ftype = CFUNCTYPE(*((restype,) + tuple(argtypes)))
+        func = cast(addr, ftype)
+        _link_cache[name] = func
         return func
-    except AttributeError:
-        bname = cast(pointer(create_string_buffer(kiglent.util.asbytes(name))), POINTER(c_ubyte))
-        addr = eglGetProcAddress(bname)
-        if addr:
-            ftype = CFUNCTYPE(*((restype,) + tuple(argtypes)))
-            func = cast(addr, ftype)
-            return func
 
     return kiglent.gl.lib.missing_function(name, requires, suggestions)
@@ -14,12 +14,18 @@ All objects are immutable and hashable.
 
 from __future__ import annotations
 
+import ctypes as _ctypes
+import itertools as _itertools
 import math as _math
+import operator as _operator
 import typing as _typing
 import warnings as _warnings
 
-if _typing.TYPE_CHECKING:
-    from kiglent.vector import Vec3, Vec4
+from kiglent.vector import Vec3, Vec4
+
+# Builds a matrix from an iterable of all its values, skipping the NamedTuple
+# constructor's argument handling. Every matrix operation returns through it.
+_tuple_new = tuple.__new__
 
 
 class Mat3(_typing.NamedTuple):
@@ -47,35 +53,52 @@ class Mat3(_typing.NamedTuple):
     h: float = 0.0
     i: float = 1.0
 
+    # These multiply on the right by a sparse transform, so only the affected columns are computed.
+
     def scale(self, sx: float, sy: float) -> Mat3:
-        return self @ Mat3(1.0 / sx, 0.0, 0.0, 0.0, 1.0 / sy, 0.0, 0.0, 0.0, 1.0)
+        a, b, c, d, e, f, g, h, i = self
+        inv_x = 1.0 / sx
+        inv_y = 1.0 / sy
+        return _tuple_new(Mat3, (a * inv_x, b * inv_x, c * inv_x,
+                                 d * inv_y, e * inv_y, f * inv_y,
+                                 g, h, i))
 
     def translate(self, tx: float, ty: float) -> Mat3:
-        return self @ Mat3(1.0, 0.0, 0.0, 0.0, 1.0, 0.0, -tx, ty, 1.0)
+        a, b, c, d, e, f, g, h, i = self
+        return _tuple_new(Mat3, (a, b, c,
+                                 d, e, f,
+                                 g - a * tx + d * ty, h - b * tx + e * ty, i - c * tx + f * ty))
 
     def rotate(self, phi: float) -> Mat3:
-        s = _math.sin(_math.radians(phi))
-        c = _math.cos(_math.radians(phi))
-        return self @ Mat3(c, s, 0.0, -s, c, 0.0, 0.0, 0.0, 1.0)
+        angle = _math.radians(phi)
+        s = _math.sin(angle)
+        co = _math.cos(angle)
+        a, b, c, d, e, f, g, h, i = self
+        return _tuple_new(Mat3, (a * co + d * s, b * co + e * s, c * co + f * s,
+                                 d * co - a * s, e * co - b * s, f * co - c * s,
+                                 g, h, i))
 
     def shear(self, sx: float, sy: float) -> Mat3:
-        return self @ Mat3(1.0, sy, 0.0, sx, 1.0, 0.0, 0.0, 0.0, 1.0)
+        a, b, c, d, e, f, g, h, i = self
+        return _tuple_new(Mat3, (a + d * sy, b + e * sy, c + f * sy,
+                                 a * sx + d, b * sx + e, c * sx + f,
+                                 g, h, i))
 
     def __add__(self, other: Mat3) -> Mat3:
         if not isinstance(other, Mat3):
             raise TypeError("Can only add to other Mat3 types")
-        return Mat3(*(s + o for s, o in zip(self, other)))
+        return _tuple_new(Mat3, map(_operator.add, self, other))
 
     def __sub__(self, other: Mat3) -> Mat3:
         if not isinstance(other, Mat3):
             raise TypeError("Can only subtract from other Mat3 types")
-        return Mat3(*(s - o for s, o in zip(self, other)))
+        return _tuple_new(Mat3, map(_operator.sub, self, other))
 
     def __pos__(self) -> Mat3:
         return self
 
     def __neg__(self) -> Mat3:
-        return Mat3(*(-v for v in self))
+        return _tuple_new(Mat3, map(_operator.neg, self))
 
     def __invert__(self) -> Mat3:
         # extract the elements in row-column form. (matrix is stored column first)
@@ -106,12 +129,12 @@ class Mat3(_typing.NamedTuple):
         rep = 1.0 / det
 
         # get inverse: A^-1 = def(A)^-1 * adj(A)
-        return Mat3(*(a * rep, b * rep, c * rep,
-                      d * rep, e * rep, f * rep,
-                      g * rep, h * rep, i * rep))
+        return _tuple_new(Mat3, (a * rep, b * rep, c * rep,
+                                 d * rep, e * rep, f * rep,
+                                 g * rep, h * rep, i * rep))
 
     def __round__(self, ndigits: int | None = None) -> Mat3:
-        return Mat3(*(round(v, ndigits) for v in self))
+        return _tuple_new(Mat3, map(round, self, _itertools.repeat(ndigits)))
 
     def __mul__(self, other: object) -> _typing.NoReturn:
         msg = "Please use the @ operator for Matrix multiplication."
@@ -124,29 +147,41 @@ class Mat3(_typing.NamedTuple):
     def __matmul__(self, other: Mat3) -> Mat3: ...
 
     def __matmul__(self, other) -> Vec3 | Mat3:
-        try:
-            # extract the elements in row-column form. (matrix is stored column first)
-            a11, a12, a13, a21, a22, a23, a31, a32, a33 = self
-            b11, b12, b13, b21, b22, b23, b31, b32, b33 = other
-
-            # Multiply and sum rows * columns
-            return Mat3(
-                # Column 1
-                a11 * b11 + a21 * b12 + a31 * b13, a12 * b11 + a22 * b12 + a32 * b13, a13 * b11 + a23 * b12 + a33 * b13,
-                # Column 2
-                a11 * b21 + a21 * b22 + a31 * b23, a12 * b21 + a22 * b22 + a32 * b23, a13 * b21 + a23 * b22 + a33 * b23,
-                # Column 3
-                a11 * b31 + a21 * b32 + a31 * b33, a12 * b31 + a22 * b32 + a32 * b33, a13 * b31 + a23 * b32 + a33 * b33,
-            )
-        except ValueError:
+        # Any operand which is not a matrix (or 9 values) is a vector.
+        if other.__class__ is not Mat3 and len(other) != 9:
             x, y, z = other
             # extract the elements in row-column form. (matrix is stored column first)
             a11, a12, a13, a21, a22, a23, a31, a32, a33 = self
-            return Vec3(
+            return _tuple_new(Vec3, (
                 a11 * x + a21 * y + a31 * z,
                 a12 * x + a22 * y + a32 * z,
                 a13 * x + a23 * y + a33 * z,
-            )
+            ))
+
+        # extract the elements in row-column form. (matrix is stored column first)
+        a11, a12, a13, a21, a22, a23, a31, a32, a33 = self
+        b11, b12, b13, b21, b22, b23, b31, b32, b33 = other
+
+        if b13 == b23 == 0.0 and b33 == 1.0:
+            # 2D affine transforms have a last row of (0, 0, 1).
+            return _tuple_new(Mat3, (
+                # Column 1
+                a11 * b11 + a21 * b12, a12 * b11 + a22 * b12, a13 * b11 + a23 * b12,
+                # Column 2
+                a11 * b21 + a21 * b22, a12 * b21 + a22 * b22, a13 * b21 + a23 * b22,
+                # Column 3
+                a11 * b31 + a21 * b32 + a31, a12 * b31 + a22 * b32 + a32, a13 * b31 + a23 * b32 + a33,
+            ))
+
+        # Multiply and sum rows * columns
+        return _tuple_new(Mat3, (
+            # Column 1
+            a11 * b11 + a21 * b12 + a31 * b13, a12 * b11 + a22 * b12 + a32 * b13, a13 * b11 + a23 * b12 + a33 * b13,
+            # Column 2
+            a11 * b21 + a21 * b22 + a31 * b23, a12 * b21 + a22 * b22 + a32 * b23, a13 * b21 + a23 * b22 + a33 * b23,
+            # Column 3
+            a11 * b31 + a21 * b32 + a31 * b33, a12 * b31 + a22 * b32 + a32 * b33, a13 * b31 + a23 * b32 + a33 * b33,
+        ))
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}{self[0:3]}\n    {self[3:6]}\n    {self[6:9]}"
@@ -209,10 +244,10 @@ class Mat4(_typing.NamedTuple):
         t_y = -(top + bottom) / height
         t_z = -(z_far + z_near) / depth
 
-        return cls(s_x, 0.0, 0.0, 0.0,
-                   0.0, s_y, 0.0, 0.0,
-                   0.0, 0.0, s_z, 0.0,
-                   t_x, t_y, t_z, 1.0)
+        return _tuple_new(cls, (s_x, 0.0, 0.0, 0.0,
+                               0.0, s_y, 0.0, 0.0,
+                               0.0, 0.0, s_z, 0.0,
+                               t_x, t_y, t_z, 1.0))
 
     @classmethod
     def perspective_projection(cls: type[Mat4], aspect: float, z_near: float, z_far: float, fov: float = 60) -> Mat4:
@@ -236,10 +271,10 @@ class Mat4(_typing.NamedTuple):
         w = w / aspect
         h = 2 * z_near / height
 
-        return cls(w, 0, 0, 0,
-                   0, h, 0, 0,
-                   0, 0, q, -1,
-                   0, 0, qn, 0)
+        return _tuple_new(cls, (w, 0, 0, 0,
+                               0, h, 0, 0,
+                               0, 0, q, -1,
+                               0, 0, qn, 0))
 
     @classmethod
     def from_rotation(cls, angle: float, vector: Vec3) -> Mat4:
@@ -249,23 +284,27 @@ class Mat4(_typing.NamedTuple):
           angle: The desired angle, in radians.
           vector: A Vec3 indicating the direction.
         """
-        return cls().rotate(angle, vector)
+        b11, b12, b13, b21, b22, b23, b31, b32, b33 = _axis_rotation(angle, vector)
+        return _tuple_new(cls, (b11, b12, b13, 0.0,
+                                b21, b22, b23, 0.0,
+                                b31, b32, b33, 0.0,
+                                0.0, 0.0, 0.0, 1.0))
 
     @classmethod
     def from_scale(cls: type[Mat4], vector: Vec3) -> Mat4:
         """Create a scale matrix from a Vec3."""
-        return cls(vector.x, 0.0, 0.0, 0.0,
-                   0.0, vector.y, 0.0, 0.0,
-                   0.0, 0.0, vector.z, 0.0,
-                   0.0, 0.0, 0.0, 1.0)
+        return _tuple_new(cls, (vector.x, 0.0, 0.0, 0.0,
+                               0.0, vector.y, 0.0, 0.0,
+                               0.0, 0.0, vector.z, 0.0,
+                               0.0, 0.0, 0.0, 1.0))
 
     @classmethod
     def from_translation(cls: type[Mat4], vector: Vec3) -> Mat4:
         """Create a translation matrix from a Vec3."""
-        return cls(1.0, 0.0, 0.0, 0.0,
-                   0.0, 1.0, 0.0, 0.0,
-                   0.0, 0.0, 1.0, 0.0,
-                   vector.x, vector.y, vector.z, 1.0)
+        return _tuple_new(cls, (1.0, 0.0, 0.0, 0.0,
+                               0.0, 1.0, 0.0, 0.0,
+                               0.0, 0.0, 1.0, 0.0,
+                               vector.x, vector.y, vector.z, 1.0))
 
     @classmethod
     def look_at(cls: type[Mat4], position: Vec3, target: Vec3, up: Vec3) -> Mat4:
@@ -286,10 +325,10 @@ class Mat4(_typing.NamedTuple):
         s = f.cross(u).normalize()
         u = s.cross(f)
 
-        return cls(s.x, u.x, -f.x, 0.0,
-                   s.y, u.y, -f.y, 0.0,
-                   s.z, u.z, -f.z, 0.0,
-                   -s.dot(position), -u.dot(position), f.dot(position), 1.0)
+        return _tuple_new(cls, (s.x, u.x, -f.x, 0.0,
+                               s.y, u.y, -f.y, 0.0,
+                               s.z, u.z, -f.z, 0.0,
+                               -s.dot(position), -u.dot(position), f.dot(position), 1.0))
 
     def row(self, index: int) -> tuple:
         """Get a specific row as a tuple."""
@@ -301,29 +340,9 @@ class Mat4(_typing.NamedTuple):
 
     def rotate(self, angle: float, vector: Vec3) -> Mat4:
         a11, a12, a13, a14, a21, a22, a23, a24, a31, a32, a33, a34, a41, a42, a43, a44 = self
+        b11, b12, b13, b21, b22, b23, b31, b32, b33 = _axis_rotation(angle, vector)
         
-        x, y, z = vector
-        d = _math.sqrt(x ** 2 + y ** 2 + z ** 2)
-        if d != 0.0:
-            x = x / d
-            y = y / d
-            z = z / d
-        c = _math.cos(angle)
-        s = _math.sin(angle)
-        t = 1 - c
-        t_x, t_y, t_z = t * x, t * y, t * z
-
-        b11 = c + t_x * x
-        b12 = t_x * y + s * z
-        b13 = t_x * z - s * y
-        b21 = t_y * x - s * z
-        b22 = c + t_y * y
-        b23 = t_y * z + s * x
-        b31 = t_z * x + s * y
-        b32 = t_z * y - s * x
-        b33 = c + t_z * z
-        
-        return Mat4(
+        return _tuple_new(Mat4, (
             # Column 1
             a11 * b11 + a21 * b12 + a31 * b13, a12 * b11 + a22 * b12 + a32 * b13,
             a13 * b11 + a23 * b12 + a33 * b13, a14 * b11 + a24 * b12 + a34 * b13,
@@ -335,7 +354,7 @@ class Mat4(_typing.NamedTuple):
             a13 * b31 + a23 * b32 + a33 * b33, a14 * b31 + a24 * b32 + a34 * b33,
             # Column 4
             a41, a42, a43, a44,
-        )
+        ))
 
     def rotate_z(self, angle: float) -> Mat4:
         a11, a12, a13, a14, a21, a22, a23, a24, a31, a32, a33, a34, a41, a42, a43, a44 = self
@@ -343,112 +362,204 @@ class Mat4(_typing.NamedTuple):
         c = _math.cos(angle)
         s = _math.sin(angle)
 
-        return Mat4(
+        return _tuple_new(Mat4, (
             a11 * c + a21 * s, a12 * c + a22 * s,
             a13 * c + a23 * s, a14 * c + a24 * s,
             -a11 * s + a21 * c, -a12 * s + a22 * c,
             -a13 * s + a23 * c, -a14 * s + a24 * c,
             a31, a32, a33, a34,
             a41, a42, a43, a44,
-        )
+        ))
+
+    def scale(self, vector: Vec3 | _typing.Sequence[float]) -> Mat4:
+        """Get a scale Matrix on x, y, or z axis.
 
-    def scale(self, vector: Vec3) -> Mat4:
-        """Get a scale Matrix on x, y, or z axis."""
+        ``vector`` may be a Vec3 or any sequence of three floats, such as a ctypes array.
+        """
         a11, a12, a13, a14, a21, a22, a23, a24, a31, a32, a33, a34, a41, a42, a43, a44 = self
         x, y, z = vector
-        return Mat4(
+        return _tuple_new(Mat4, (
             a11 * x, a12, a13, a14,
             a21, a22 * y, a23, a24,
             a31, a32, a33 * z, a34,
             a41, a42, a43, a44,
-        )
+        ))
+
+    def scale_columns(self, vector: Vec3 | _typing.Sequence[float]) -> Mat4:
+        """Get this Matrix multiplied on the right by a scale Matrix.
 
-    def translate(self, vector: Vec3) -> Mat4:
-        """Get a translation Matrix along x, y, and z axis."""
+        ``scale`` only scales the diagonal, which is the same only when this
+        Matrix has no rotation. This scales the first three columns instead,
+        so it is also correct for rotated Matrices.
+
+        ``vector`` may be a Vec3 or any sequence of three floats, such as a ctypes array.
+        """
         a11, a12, a13, a14, a21, a22, a23, a24, a31, a32, a33, a34, a41, a42, a43, a44 = self
         x, y, z = vector
-        return Mat4(
+        # Only the first three columns change.
+        return _tuple_new(Mat4, (
+            a11 * x, a12 * x, a13 * x, a14 * x,
+            a21 * y, a22 * y, a23 * y, a24 * y,
+            a31 * z, a32 * z, a33 * z, a34 * z,
+            a41, a42, a43, a44,
+        ))
+
+    def translate(self, vector: Vec3 | _typing.Sequence[float]) -> Mat4:
+        """Get a translation Matrix along x, y, and z axis.
+
+        ``vector`` may be a Vec3 or any sequence of three floats, such as a ctypes array.
+        """
+        a11, a12, a13, a14, a21, a22, a23, a24, a31, a32, a33, a34, a41, a42, a43, a44 = self
+        x, y, z = vector
+        # Only the fourth column changes.
+        return _tuple_new(Mat4, (
             a11, a12, a13, a14,
             a21, a22, a23, a24,
             a31, a32, a33, a34,
             a11 * x + a21 * y + a31 * z + a41, a12 * x + a22 * y + a32 * z + a42,
             a13 * x + a23 * y + a33 * z + a43, a14 * x + a24 * y + a34 * z + a44,
-        )
+        ))
+
+    def transformed(self, translate: Vec3 | None = None, rotate: tuple[float, Vec3] | None = None,
+                    scale: Vec3 | None = None) -> Mat4:
+        """Get this Matrix translated, then rotated, then scaled.
+
+        This is the same as chaining ``translate``, ``rotate`` and ``scale``,
+        but is done in one pass, without creating the Matrices in between.
+
+        Args:
+          translate: The translation along the x, y, and z axis.
+          rotate: The angle, in radians, and a Vec3 axis to rotate around.
+          scale: The scale on the x, y, and z axis.
+        """
+        a11, a12, a13, a14, a21, a22, a23, a24, a31, a32, a33, a34, a41, a42, a43, a44 = self
+
+        if translate is not None:
+            x, y, z = translate
+            a41, a42, a43, a44 = (a11 * x + a21 * y + a31 * z + a41, a12 * x + a22 * y + a32 * z + a42,
+                                  a13 * x + a23 * y + a33 * z + a43, a14 * x + a24 * y + a34 * z + a44)
+
+        if rotate is not None:
+            b11, b12, b13, b21, b22, b23, b31, b32, b33 = _axis_rotation(*rotate)
+            a11, a12, a13, a14, a21, a22, a23, a24, a31, a32, a33, a34 = (
+                # Column 1
+                a11 * b11 + a21 * b12 + a31 * b13, a12 * b11 + a22 * b12 + a32 * b13,
+                a13 * b11 + a23 * b12 + a33 * b13, a14 * b11 + a24 * b12 + a34 * b13,
+                # Column 2
+                a11 * b21 + a21 * b22 + a31 * b23, a12 * b21 + a22 * b22 + a32 * b23,
+                a13 * b21 + a23 * b22 + a33 * b23, a14 * b21 + a24 * b22 + a34 * b23,
+                # Column 3
+                a11 * b31 + a21 * b32 + a31 * b33, a12 * b31 + a22 * b32 + a32 * b33,
+                a13 * b31 + a23 * b32 + a33 * b33, a14 * b31 + a24 * b32 + a34 * b33,
+            )
+
+        if scale is not None:
+            x, y, z = scale
+            a11, a22, a33 = a11 * x, a22 * y, a33 * z
+
+        return _tuple_new(Mat4, (a11, a12, a13, a14,
+                                 a21, a22, a23, a24,
+                                 a31, a32, a33, a34,
+                                 a41, a42, a43, a44))
 
     def transpose(self) -> Mat4:
         """Get a transpose of this Matrix."""
-        return Mat4(*self[0::4], *self[1::4], *self[2::4], *self[3::4])
+        a11, a12, a13, a14, a21, a22, a23, a24, a31, a32, a33, a34, a41, a42, a43, a44 = self
+        return _tuple_new(Mat4, (a11, a21, a31, a41,
+                                 a12, a22, a32, a42,
+                                 a13, a23, a33, a43,
+                                 a14, a24, a34, a44))
 
     def __add__(self, other: Mat4) -> Mat4:
         if not isinstance(other, Mat4):
             raise TypeError("Can only add to other Mat4 types")
-        return Mat4(*(s + o for s, o in zip(self, other)))
+        return _tuple_new(Mat4, map(_operator.add, self, other))
 
     def __sub__(self, other: Mat4) -> Mat4:
         if not isinstance(other, Mat4):
             raise TypeError("Can only subtract from other Mat4 types")
-        return Mat4(*(s - o for s, o in zip(self, other)))
+        return _tuple_new(Mat4, map(_operator.sub, self, other))
 
     def __pos__(self) -> Mat4:
         return self
 
     def __neg__(self) -> Mat4:
-        return Mat4(*(-v for v in self))
+        return _tuple_new(Mat4, map(_operator.neg, self))
 
     def __invert__(self) -> Mat4:
         # extract the elements in row-column form. (matrix is stored column first)
         a11, a12, a13, a14, a21, a22, a23, a24, a31, a32, a33, a34, a41, a42, a43, a44 = self
 
-        a = a33 * a44 - a34 * a43
-        b = a32 * a44 - a34 * a42
-        c = a32 * a43 - a33 * a42
-        d = a31 * a44 - a34 * a41
-        e = a31 * a43 - a33 * a41
-        f = a31 * a42 - a32 * a41
-        g = a23 * a44 - a24 * a43
-        h = a22 * a44 - a24 * a42
-        i = a22 * a43 - a23 * a42
-        j = a23 * a34 - a24 * a33
-        k = a22 * a34 - a24 * a32
-        l = a22 * a33 - a23 * a32
-        m = a21 * a44 - a24 * a41
-        n = a21 * a43 - a23 * a41
-        o = a21 * a34 - a24 * a31
-        p = a21 * a33 - a23 * a31
-        q = a21 * a42 - a22 * a41
-        r = a21 * a32 - a22 * a31
-
-        det = (a11 * (a22 * a - a23 * b + a24 * c) -
-               a12 * (a21 * a - a23 * d + a24 * e) +
-               a13 * (a21 * b - a22 * d + a24 * f) -
-               a14 * (a21 * c - a22 * e + a23 * f))
+        if a14 == a24 == a34 == 0.0 and a44 == 1.0:
+            # Affine: invert the upper 3x3 block, then move the translation through it.
+            c11 = a22 * a33 - a32 * a23
+            c12 = a32 * a13 - a12 * a33
+            c13 = a12 * a23 - a22 * a13
+            det = a11 * c11 + a21 * c12 + a31 * c13
+
+            if det == 0:
+                _warnings.warn("Unable to calculate inverse of singular Matrix")
+                return self
+
+            rep = 1.0 / det
+            b11, b12, b13 = c11 * rep, c12 * rep, c13 * rep
+            b21 = (a31 * a23 - a21 * a33) * rep
+            b22 = (a11 * a33 - a31 * a13) * rep
+            b23 = (a21 * a13 - a11 * a23) * rep
+            b31 = (a21 * a32 - a31 * a22) * rep
+            b32 = (a31 * a12 - a11 * a32) * rep
+            b33 = (a11 * a22 - a21 * a12) * rep
+
+            return _tuple_new(Mat4, (b11, b12, b13, 0.0,
+                                     b21, b22, b23, 0.0,
+                                     b31, b32, b33, 0.0,
+                                     -(b11 * a41 + b21 * a42 + b31 * a43),
+                                     -(b12 * a41 + b22 * a42 + b32 * a43),
+                                     -(b13 * a41 + b23 * a42 + b33 * a43), 1.0))
+
+        # Laplace expansion along the first two columns: 2x2 minors of those,
+        # and of the last two columns, give both the determinant and the adjugate.
+        s0 = a11 * a22 - a21 * a12
+        s1 = a11 * a23 - a21 * a13
+        s2 = a11 * a24 - a21 * a14
+        s3 = a12 * a23 - a22 * a13
+        s4 = a12 * a24 - a22 * a14
+        s5 = a13 * a24 - a23 * a14
+
+        c5 = a33 * a44 - a43 * a34
+        c4 = a32 * a44 - a42 * a34
+        c3 = a32 * a43 - a42 * a33
+        c2 = a31 * a44 - a41 * a34
+        c1 = a31 * a43 - a41 * a33
+        c0 = a31 * a42 - a41 * a32
+
+        det = s0 * c5 - s1 * c4 + s2 * c3 + s3 * c2 - s4 * c1 + s5 * c0
 
         if det == 0:
             _warnings.warn("Unable to calculate inverse of singular Matrix")
             return self
 
-        pdet = 1 / det
-        ndet = -pdet
-
-        return Mat4(pdet * (a22 * a - a23 * b + a24 * c),
-                    ndet * (a12 * a - a13 * b + a14 * c),
-                    pdet * (a12 * g - a13 * h + a14 * i),
-                    ndet * (a12 * j - a13 * k + a14 * l),
-                    ndet * (a21 * a - a23 * d + a24 * e),
-                    pdet * (a11 * a - a13 * d + a14 * e),
-                    ndet * (a11 * g - a13 * m + a14 * n),
-                    pdet * (a11 * j - a13 * o + a14 * p),
-                    pdet * (a21 * b - a22 * d + a24 * f),
-                    ndet * (a11 * b - a12 * d + a14 * f),
-                    pdet * (a11 * h - a12 * m + a14 * q),
-                    ndet * (a11 * k - a12 * o + a14 * r),
-                    ndet * (a21 * c - a22 * e + a23 * f),
-                    pdet * (a11 * c - a12 * e + a13 * f),
-                    ndet * (a11 * i - a12 * n + a13 * q),
-                    pdet * (a11 * l - a12 * p + a13 * r))
-
-    def __round__(self, ndigits: int | None) -> Mat4:
-        return Mat4(*(round(v, ndigits) for v in self))
+        rep = 1.0 / det
+
+        return _tuple_new(Mat4, ((a22 * c5 - a23 * c4 + a24 * c3) * rep,
+                                 (a13 * c4 - a12 * c5 - a14 * c3) * rep,
+                                 (a42 * s5 - a43 * s4 + a44 * s3) * rep,
+                                 (a33 * s4 - a32 * s5 - a34 * s3) * rep,
+                                 (a23 * c2 - a21 * c5 - a24 * c1) * rep,
+                                 (a11 * c5 - a13 * c2 + a14 * c1) * rep,
+                                 (a43 * s2 - a41 * s5 - a44 * s1) * rep,
+                                 (a31 * s5 - a33 * s2 + a34 * s1) * rep,
+                                 (a21 * c4 - a22 * c2 + a24 * c0) * rep,
+                                 (a12 * c2 - a11 * c4 - a14 * c0) * rep,
+                                 (a41 * s4 - a42 * s2 + a44 * s0) * rep,
+                                 (a32 * s2 - a31 * s4 - a34 * s0) * rep,
+                                 (a22 * c1 - a21 * c3 - a23 * c0) * rep,
+                                 (a11 * c3 - a12 * c1 + a13 * c0) * rep,
+                                 (a42 * s1 - a41 * s3 - a43 * s0) * rep,
+                                 (a31 * s3 - a32 * s1 + a33 * s0) * rep))
+
+    def __round__(self, ndigits: int | None = None) -> Mat4:
+        return _tuple_new(Mat4, map(round, self, _itertools.repeat(ndigits)))
 
     def __mul__(self, other: int) -> _typing.NoReturn:
         msg = "Please use the @ operator for Matrix multiplication."
@@ -461,12 +572,100 @@ class Mat4(_typing.NamedTuple):
     def __matmul__(self, other: Mat4) -> Mat4: ...
 
     def __matmul__(self, other):
-        try:
+        # Any operand which is not a matrix (or 16 values) is a vector.
+        if other.__class__ is not Mat4 and len(other) != 16:
+            x, y, z, w = other
             # extract the elements in row-column form. (matrix is stored column first)
             a11, a12, a13, a14, a21, a22, a23, a24, a31, a32, a33, a34, a41, a42, a43, a44 = self
-            b11, b12, b13, b14, b21, b22, b23, b24, b31, b32, b33, b34, b41, b42, b43, b44 = other
-            # Multiply and sum rows * columns:
-            return Mat4(
+            return _tuple_new(Vec4, (
+                x * a11 + y * a21 + z * a31 + w * a41,
+                x * a12 + y * a22 + z * a32 + w * a42,
+                x * a13 + y * a23 + z * a33 + w * a43,
+                x * a14 + y * a24 + z * a34 + w * a44,
+            ))
+
+        # extract the elements in row-column form. (matrix is stored column first)
+        a11, a12, a13, a14, a21, a22, a23, a24, a31, a32, a33, a34, a41, a42, a43, a44 = self
+        b11, b12, b13, b14, b21, b22, b23, b24, b31, b32, b33, b34, b41, b42, b43, b44 = other
+        if b14 == b24 == b34 == 0.0 and b44 == 1.0:
+            # Affine transforms, such as model and view matrices, have a last row
+            # of (0, 0, 0, 1), which drops a quarter of the products.
+            return _tuple_new(Mat4, (
+                # Column 1
+                a11 * b11 + a21 * b12 + a31 * b13, a12 * b11 + a22 * b12 + a32 * b13,
+                a13 * b11 + a23 * b12 + a33 * b13, a14 * b11 + a24 * b12 + a34 * b13,
+                # Column 2
+                a11 * b21 + a21 * b22 + a31 * b23, a12 * b21 + a22 * b22 + a32 * b23,
+                a13 * b21 + a23 * b22 + a33 * b23, a14 * b21 + a24 * b22 + a34 * b23,
+                # Column 3
+                a11 * b31 + a21 * b32 + a31 * b33, a12 * b31 + a22 * b32 + a32 * b33,
+                a13 * b31 + a23 * b32 + a33 * b33, a14 * b31 + a24 * b32 + a34 * b33,
+                # Column 4
+                a11 * b41 + a21 * b42 + a31 * b43 + a41, a12 * b41 + a22 * b42 + a32 * b43 + a42,
+                a13 * b41 + a23 * b42 + a33 * b43 + a43, a14 * b41 + a24 * b42 + a34 * b43 + a44,
+            ))
+        # Multiply and sum rows * columns:
+        return _tuple_new(Mat4, (
+            # Column 1
+            a11 * b11 + a21 * b12 + a31 * b13 + a41 * b14, a12 * b11 + a22 * b12 + a32 * b13 + a42 * b14,
+            a13 * b11 + a23 * b12 + a33 * b13 + a43 * b14, a14 * b11 + a24 * b12 + a34 * b13 + a44 * b14,
+            # Column 2
+            a11 * b21 + a21 * b22 + a31 * b23 + a41 * b24, a12 * b21 + a22 * b22 + a32 * b23 + a42 * b24,
+            a13 * b21 + a23 * b22 + a33 * b23 + a43 * b24, a14 * b21 + a24 * b22 + a34 * b23 + a44 * b24,
+            # Column 3
+            a11 * b31 + a21 * b32 + a31 * b33 + a41 * b34, a12 * b31 + a22 * b32 + a32 * b33 + a42 * b34,
+            a13 * b31 + a23 * b32 + a33 * b33 + a43 * b34, a14 * b31 + a24 * b32 + a34 * b33 + a44 * b34,
+            # Column 4
+            a11 * b41 + a21 * b42 + a31 * b43 + a41 * b44, a12 * b41 + a22 * b42 + a32 * b43 + a42 * b44,
+            a13 * b41 + a23 * b42 + a33 * b43 + a43 * b44, a14 * b41 + a24 * b42 + a34 * b43 + a44 * b44,
+        ))
+
+    def transform_points(self, points: _typing.Iterable[Vec3 | _typing.Sequence[float]]) -> list[Vec4]:
+        """Transform many points by this Matrix.
+
+        Each point has three components, and is given a ``w`` of 1.0. This
+        gives the same results as ``[self @ Vec4(x, y, z, 1.0) for x, y, z in points]``,
+        but only unpacks this Matrix once.
+        """
+        a11, a12, a13, a14, a21, a22, a23, a24, a31, a32, a33, a34, a41, a42, a43, a44 = self
+        new = _tuple_new
+        return [new(Vec4, (a11 * x + a21 * y + a31 * z + a41, a12 * x + a22 * y + a32 * z + a42,
+                           a13 * x + a23 * y + a33 * z + a43, a14 * x + a24 * y + a34 * z + a44))
+                for x, y, z in points]
+
+    def transform_directions(self, directions: _typing.Iterable[Vec3 | _typing.Sequence[float]]) -> list[Vec3]:
+        """Transform many direction vectors by this Matrix.
+
+        Directions are not moved by translation, so only the upper 3x3 block
+        of this Matrix is applied.
+        """
+        a11, a12, a13, _, a21, a22, a23, _, a31, a32, a33, _, _, _, _, _ = self
+        new = _tuple_new
+        return [new(Vec3, (a11 * x + a21 * y + a31 * z, a12 * x + a22 * y + a32 * z, a13 * x + a23 * y + a33 * z))
+                for x, y, z in directions]
+
+    @staticmethod
+    def pack(matrices: _typing.Sequence[Mat4]) -> _ctypes.Array[_ctypes.c_float]:
+        """Pack many matrices into one contiguous array of 32-bit floats.
+
+        The array can be uploaded to a uniform, storage, or vertex buffer in
+        a single call, so that a large number of transforms can be applied
+        by a shader on the GPU, rather than one at a time in Python.
+        """
+        return (_ctypes.c_float * (16 * len(matrices)))(*_itertools.chain.from_iterable(matrices))
+
+    def matmul_all(self, others: _typing.Iterable[Mat4]) -> list[Mat4]:
+        """Multiply this Matrix by each of several Matrices.
+
+        This gives the same results as ``[self @ other for other in others]``,
+        but only unpacks this Matrix once. This is useful for applying a parent
+        transform to many child transforms.
+        """
+        a11, a12, a13, a14, a21, a22, a23, a24, a31, a32, a33, a34, a41, a42, a43, a44 = self
+        results = []
+        append = results.append
+        for b11, b12, b13, b14, b21, b22, b23, b24, b31, b32, b33, b34, b41, b42, b43, b44 in others:
+            append(_tuple_new(Mat4, (
                 # Column 1
                 a11 * b11 + a21 * b12 + a31 * b13 + a41 * b14, a12 * b11 + a22 * b12 + a32 * b13 + a42 * b14,
                 a13 * b11 + a23 * b12 + a33 * b13 + a43 * b14, a14 * b11 + a24 * b12 + a34 * b13 + a44 * b14,
@@ -479,22 +678,43 @@ class Mat4(_typing.NamedTuple):
                 # Column 4
                 a11 * b41 + a21 * b42 + a31 * b43 + a41 * b44, a12 * b41 + a22 * b42 + a32 * b43 + a42 * b44,
                 a13 * b41 + a23 * b42 + a33 * b43 + a43 * b44, a14 * b41 + a24 * b42 + a34 * b43 + a44 * b44,
-            )
-        except ValueError:
-            x, y, z, w = other
-            # extract the elements in row-column form. (matrix is stored column first)
-            a11, a12, a13, a14, a21, a22, a23, a24, a31, a32, a33, a34, a41, a42, a43, a44 = self
-            return Vec4(
-                x * a11 + y * a21 + z * a31 + w * a41,
-                x * a12 + y * a22 + z * a32 + w * a42,
-                x * a13 + y * a23 + z * a33 + w * a43,
-                x * a14 + y * a24 + z * a34 + w * a44,
-            )
+            )))
+        return results
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}{self[0:4]}\n    {self[4:8]}\n    {self[8:12]}\n    {self[12:16]}"
 
 
+# Shared identity matrices. Matrices are immutable, so these can be used
+# anywhere a new ``Mat3()`` or ``Mat4()`` would otherwise be created.
+IDENTITY_3 = _tuple_new(Mat3, (1.0, 0.0, 0.0,
+                               0.0, 1.0, 0.0,
+                               0.0, 0.0, 1.0))
+IDENTITY_4 = _tuple_new(Mat4, (1.0, 0.0, 0.0, 0.0,
+                               0.0, 1.0, 0.0, 0.0,
+                               0.0, 0.0, 1.0, 0.0,
+                               0.0, 0.0, 0.0, 1.0))
+
+
+def _axis_rotation(angle: float, vector: Vec3) -> tuple[float, ...]:
+    """Get the 3x3 rotation of ``angle`` radians around ``vector``, in column-major order."""
+    x, y, z = vector
+    d = _math.sqrt(x * x + y * y + z * z)
+    if d != 0.0:
+        inv_d = 1.0 / d
+        x *= inv_d
+        y *= inv_d
+        z *= inv_d
+    c = _math.cos(angle)
+    s = _math.sin(angle)
+    t = 1 - c
+    t_x, t_y, t_z = t * x, t * y, t * z
+
+    return (c + t_x * x, t_x * y + s * z, t_x * z - s * y,
+            t_y * x - s * z, c + t_y * y, t_y * z + s * x,
+            t_z * x + s * y, t_z * y - s * x, c + t_z * z)
+
+
 class Quaternion(_typing.NamedTuple):
     """Quaternion.
 
@@ -514,63 +734,39 @@ class Quaternion(_typing.NamedTuple):
     def from_mat4(cls) -> Quaternion:
         raise NotImplementedError
 
+    def _rotation(self) -> tuple[float, ...]:
+        """Calculate the 3x3 rotation of this quaternion, in column-major order."""
+        w, x, y, z = self
+        x2 = x + x
+        y2 = y + y
+        z2 = z + z
+        xx = x * x2
+        yy = y * y2
+        zz = z * z2
+        xy = x * y2
+        xz = x * z2
+        yz = y * z2
+        wx = w * x2
+        wy = w * y2
+        wz = w * z2
+
+        return (1 - yy - zz, xy - wz, xz + wy,
+                xy + wz, 1 - xx - zz, yz - wx,
+                xz - wy, yz + wx, 1 - xx - yy)
+
     def to_mat4(self) -> Mat4:
         """Calculate a 4x4 transform matrix which applies a rotation."""
-
-        w = self.w
-        x = self.x
-        y = self.y
-        z = self.z
-
-        a = 1 - (y**2 + z**2) * 2
-        b = 2 * (x * y - z * w)
-        c = 2 * (x * z + y * w)
-
-        e = 2 * (x * y + z * w)
-        f = 1 - (x**2 + z**2) * 2
-        g = 2 * (y * z - x * w)
-
-        i = 2 * (x * z - y * w)
-        j = 2 * (y * z + x * w)
-        k = 1 - (x**2 + y**2) * 2
-
-        # a, b, c, -
-        # e, f, g, -
-        # i, j, k, -
-        # -, -, -, -
-
-        return Mat4(a, b, c, 0.0, e, f, g, 0.0, i, j, k, 0.0, 0.0, 0.0, 0.0, 1.0)
+        a, b, c, e, f, g, i, j, k = self._rotation()
+        return _tuple_new(Mat4, (a, b, c, 0.0, e, f, g, 0.0, i, j, k, 0.0, 0.0, 0.0, 0.0, 1.0))
 
     def to_mat3(self) -> Mat3:
         """Create a 3x3 rotation matrix."""
-
-        w = self.w
-        x = self.x
-        y = self.y
-        z = self.z
-
-        a = 1 - (y**2 + z**2) * 2
-        b = 2 * (x * y - z * w)
-        c = 2 * (x * z + y * w)
-
-        e = 2 * (x * y + z * w)
-        f = 1 - (x**2 + z**2) * 2
-        g = 2 * (y * z - x * w)
-
-        i = 2 * (x * z - y * w)
-        j = 2 * (y * z + x * w)
-        k = 1 - (x**2 + y**2) * 2
-
-        # a, b, c, -
-        # e, f, g, -
-        # i, j, k, -
-        # -, -, -, -
-
-        return Mat3(*(a, b, c, e, f, g, i, j, k))
+        return _tuple_new(Mat3, self._rotation())
 
     def length(self) -> float:
         """Calculate the length of the quaternion from the origin."""
-        return _math.sqrt(self.w**2 + self.x**2 + self.y**2 + self.z**2)
+        w, x, y, z = self
+        return _math.sqrt(w * w + x * x + y * y + z * z)
 
     def conjugate(self) -> Quaternion:
         """Calculate the conjugate of this quaternion.
@@ -600,7 +796,9 @@ class Quaternion(_typing.NamedTuple):
         m = self.length()
         if m == 0:
             return self
-        return Quaternion(self.w / m, self.x / m, self.y / m, self.z / m)
+        inv = 1.0 / m
+        w, x, y, z = self
+        return _tuple_new(Quaternion, (w * inv, x * inv, y * inv, z * inv))
 
     def __add__(self, other: Quaternion) -> Quaternion:
         a, b, c, d = self
@@ -33,7 +33,8 @@ from typing import TYPE_CHECKING
 
 import kiglent
 from kiglent import gl, graphics
-from kiglent.matrix import Mat4
+from kiglent.graphics.groups import bind_texture
+from kiglent.matrix import IDENTITY_4, Mat4
 
 from .codecs import add_default_codecs as _add_default_codecs
 from .codecs import registry as _codec_registry
@@ -101,7 +102,7 @@ class Model:
         self.vertex_lists = vertex_lists
         self.groups = groups
         self._batch = batch or graphics.Batch()
-        self._modelview_matrix = Mat4()
+        self._modelview_matrix = IDENTITY_4
 
     @property
     def batch(self) -> Batch:
@@ -141,7 +142,7 @@ class Model:
 class BaseMaterialGroup(graphics.Group):
     default_vert_src: str
     default_frag_src: str
-    matrix: Mat4 = Mat4()
+    matrix: Mat4 = IDENTITY_4
 
     def __init__(self, material: SimpleMaterial, program: ShaderProgram, order: int = 0, parent: Group | None = None) -> None:
         super().__init__(order, parent)
@@ -206,8 +207,7 @@ class TexturedMaterialGroup(BaseMaterialGroup):
         self.texture = texture
 
     def set_state(self) -> None:
-        gl.glActiveTexture(gl.GL_TEXTURE0)
-        gl.glBindTexture(self.texture.target, self.texture.id)
+        bind_texture(self.texture.target, self.texture.id)
         self.program.use()
         self.program['model'] = self.matrix
 
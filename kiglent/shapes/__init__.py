@@ -66,14 +66,17 @@ from __future__ import annotations
 
 import math
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Sequence, Type
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, Sequence, Type
 
 import kiglent
 from kiglent.gl import GL_BLEND, GL_ONE_MINUS_SRC_ALPHA, GL_SRC_ALPHA, GL_TRIANGLES, glBlendFunc, glDisable, glEnable
-from kiglent.graphics import Batch, Group
+from kiglent.graphics import Batch, Group, invalidate_state_cache
 from kiglent.vector import Vec2
 
 if TYPE_CHECKING:
+    from ctypes import Array
+
     from kiglent.graphics.shader import ShaderProgram
     from kiglent.customtypes import ColorValue, Color4
 
@@ -131,10 +134,72 @@ def get_default_shader() -> ShaderProgram:
 
 
 def _rotate_point(center: tuple[float, float], point: tuple[float, float], angle: float) -> tuple[float, float]:
-    prev_angle = math.atan2(point[1] - center[1], point[0] - center[0])
-    now_angle = prev_angle + angle
-    r = math.dist(point, center)
-    return center[0] + r * math.cos(now_angle), center[1] + r * math.sin(now_angle)
+    cx, cy = center
+    dx = point[0] - cx
+    dy = point[1] - cy
+    cos = math.cos(angle)
+    sin = math.sin(angle)
+    return cx + dx * cos - dy * sin, cy + dx * sin + dy * cos
+
+
+def _unit_steps(step: float, count: int) -> tuple[tuple[float, ...], tuple[float, ...]]:
+    """Get the cosines and sines of ``count`` angles ``step`` radians apart, starting at 0.
+
+    Each point is the previous one rotated by ``step``, so only that single
+    angle goes through ``math.cos`` and ``math.sin``.
+    """
+    step_cos = math.cos(step)
+    step_sin = math.sin(step)
+    c = 1.0
+    s = 0.0
+    cos = [c]
+    sin = [s]
+    for _ in range(count - 1):
+        c, s = c * step_cos - s * step_sin, s * step_cos + c * step_sin
+        cos.append(c)
+        sin.append(s)
+    return tuple(cos), tuple(sin)
+
+
+@lru_cache(maxsize=64)
+def _hidden_vertices(count: int) -> tuple[int, ...]:
+    """Get the positions of ``count`` vertices collapsed to the origin, as used for hidden shapes."""
+    return (0, 0) * count
+
+
+@lru_cache(maxsize=256)
+def _unit_ring(segments: int) -> tuple[tuple[float, ...], tuple[float, ...]]:
+    """Get the cosines and sines of ``segments`` evenly spaced angles around a circle."""
+    return _unit_steps(math.pi * 2 / segments, segments)
+
+
+@lru_cache(maxsize=256)
+def _unit_arc(segments: int, angle: float) -> tuple[tuple[float, ...], tuple[float, ...]]:
+    """Get the cosines and sines of ``segments + 1`` evenly spaced angles from 0 to ``angle`` radians."""
+    return _unit_steps(angle / segments, segments + 1)
+
+
+@lru_cache(maxsize=256)
+def _fan_indices(segments: int, closed: bool) -> tuple[int, ...]:
+    """Get the indices of ``segments`` triangles joining vertex 0 to each pair of neighboring outer vertices.
+
+    The outer vertices start at index 1. A closed fan joins the last one back to the first.
+    """
+    indices = []
+    for i in range(1, segments + 1):
+        indices += (0, i, i + 1)
+    if closed:
+        indices[-1] = 1
+    return tuple(indices)
+
+
+def _fill_repeated(region: Array, values: Sequence[float], count: int) -> None:
+    """Fill an attribute region with ``values`` repeated ``count`` times.
+
+    The values are packed once in the region's C type, then repeated and
+    copied as bytes, rather than converting every repeated value.
+    """
+    memoryview(region).cast('B')[:] = bytes((region._type_ * len(values))(*values)) * count
 
 
 def _get_segment(p0: tuple[float, float] | list[float], p1: tuple[float, float] | list[float],
@@ -216,6 +281,99 @@ def _get_segment(p0: tuple[float, float] | list[float], p1: tuple[float, float]
     return v_miter2, scale2, v1[0], v1[1], v2[0], v2[1], v3[0], v3[1], v4[0], v4[1], v5[0], v5[1], v6[0], v6[1]
 
 
+def _get_path_vertices(points: Sequence[tuple[float, float]], thickness: float = 1.0,
+                       prev_point: tuple[float, float] | None = None,
+                       next_point: tuple[float, float] | None = None) -> list[float]:
+    """Computes the line segments joining each of the points to the next.
+
+    This gives the same vertices as calling :py:func:`_get_segment` for each pair of
+    points in turn, passing the miter and scale on, but works on plain floats in a
+    single pass, computing each joint between two segments only once.
+
+    Args:
+        points:
+            The points to join, at least 2 of them.
+        thickness:
+            Thickness of the miter.
+        prev_point:
+            The point before the first one, used for the miter angle at the start
+            of the line. If None is supplied then the start is 90 degrees to the
+            first segment.
+        next_point:
+            The point after the last one, used for the miter angle at the end of
+            the line. If None is supplied then the end is 90 degrees to the last
+            segment.
+    """
+    path = points
+    if prev_point:
+        path = [prev_point, *path]
+    if next_point:
+        path = [*path, next_point]
+
+    half = thickness / 2.0
+    limit = 2.0 * thickness
+    vertices = []
+
+    # The unit normal of the first segment of the path:
+    x1, y1 = path[0]
+    x2, y2 = path[1]
+    dx = x2 - x1
+    dy = y2 - y1
+    if d := math.sqrt(dx ** 2 + dy ** 2):
+        dx /= d
+        dy /= d
+    nx = -dy
+    ny = dx
+
+    # A segment from (x1, y1) is emitted once the miter at its end (x2, y2) is known.
+    # Without a point before the line, the first segment starts square to itself.
+    started = not prev_point
+    ox1 = nx * half
+    oy1 = ny * half
+    for x3, y3 in path[2:]:
+        dx = x3 - x2
+        dy = y3 - y2
+        if d := math.sqrt(dx ** 2 + dy ** 2):
+            dx /= d
+            dy /= d
+        next_nx = -dy
+        next_ny = dx
+
+        # The miter at (x2, y2) is between the normals of the segments on either side of it.
+        mx = nx + next_nx
+        my = ny + next_ny
+        if d := math.sqrt(mx ** 2 + my ** 2):
+            mx /= d
+            my /= d
+        # The normal is the segment's direction turned 90 degrees, so the dot product
+        # of the next segment's direction and the miter is that of the normal and the
+        # miter turned by 90 degrees.
+        scale = min(half / math.sin(math.acos(next_ny * mx - next_nx * my)), limit)
+        ox2 = mx * scale
+        oy2 = my * scale
+
+        if started:
+            vertices += (x1 + ox1, y1 + oy1, x2 + ox2, y2 + oy2, x1 - ox1, y1 - oy1,
+                         x2 + ox2, y2 + oy2, x2 - ox2, y2 - oy2, x1 - ox1, y1 - oy1)
+        started = True
+        x1 = x2
+        y1 = y2
+        x2 = x3
+        y2 = y3
+        nx = next_nx
+        ny = next_ny
+        ox1 = ox2
+        oy1 = oy2
+
+    if not next_point:
+        # Without a point after the line, the last segment ends square to itself.
+        ox2 = nx * half
+        oy2 = ny * half
+        vertices += (x1 + ox1, y1 + oy1, x2 + ox2, y2 + oy2, x1 - ox1, y1 - oy1,
+                     x2 + ox2, y2 + oy2, x2 - ox2, y2 - oy2, x1 - ox1, y1 - oy1)
+    return vertices
+
+
 class _ShapeGroup(Group):
     """Shared Shape rendering Group.
 
@@ -335,6 +493,18 @@ class ShapeBase(ABC):
         """Test whether a point is inside a shape."""
         raise NotImplementedError(f"The `in` operator is not supported for {self.__class__.__name__}")
 
+    def contains_points(self, points: Iterable[tuple[float, float]]) -> list[bool]:
+        """Test which of many points are inside a shape.
+
+        This gives the same results as using ``in`` with each point. Shapes
+        may override it to do the work shared by all the points only once.
+
+        Args:
+            points:
+                The ``(x, y)`` points to test.
+        """
+        return [point in self for point in points]
+
     def get_shape_group(self) -> _ShapeGroup | Group:
         """Creates and returns a group to be used to render the shape.
 
@@ -355,10 +525,10 @@ class ShapeBase(ABC):
         for each vertex in the shape. This is usually done by repeating
         `self._rgba` for each vertex.
         """
-        self._vertex_list.colors[:] = self._rgba * self._num_verts
+        _fill_repeated(self._vertex_list.colors, self._rgba, self._num_verts)
 
     def _update_translation(self) -> None:
-        self._vertex_list.translation[:] = (self._x, self._y) * self._num_verts
+        _fill_repeated(self._vertex_list.translation, (self._x, self._y), self._num_verts)
 
     def _create_vertex_list(self) -> None:
         """Build internal vertex list.
@@ -475,6 +645,8 @@ class ShapeBase(ABC):
                      and call its :py:meth:`~Batch.draw` method.
 
         """
+        # Drawing outside a batch, so the state left by earlier drawing is unknown.
+        invalidate_state_cache()
         self._group.set_state_recursive()
         self._vertex_list.draw(self._draw_mode)
         self._group.unset_state_recursive()
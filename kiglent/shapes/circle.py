@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import math
-from typing import TYPE_CHECKING, Sequence
+from itertools import chain
+from typing import TYPE_CHECKING, Iterable, Sequence
 
-from kiglent.shapes import ShapeBase, _rotate_point
+from kiglent.shapes import ShapeBase, _fan_indices, _hidden_vertices, _rotate_point, _unit_arc, _unit_ring
 from kiglent.gl import GL_ONE_MINUS_SRC_ALPHA, GL_SRC_ALPHA
 
 if TYPE_CHECKING:
@@ -15,11 +16,14 @@ if TYPE_CHECKING:
 __all__ = ['Circle', 'Ellipse', 'Sector']
 
 
-class Circle(ShapeBase):
+class Ellipse(ShapeBase):
+    # Whether the uploaded vertices are the collapsed ones of a hidden shape.
+    _vertices_hidden: bool = False
+
     def __init__(
             self,
             x: float, y: float,
-            radius: float,
+            a: float, b: float,
             segments: int | None = None,
             color: ColorValue = (255, 255, 255, 255),
             blend_src: int = GL_SRC_ALPHA,
@@ -28,24 +32,27 @@ class Circle(ShapeBase):
             group: Group | None = None,
             program: ShaderProgram | None = None,
     ) -> None:
-        """Create a circle.
+        """Create an ellipse.
 
-        The circle's anchor point (x, y) defaults to the center of the circle.
+        The ellipse's anchor point ``(x, y)`` defaults to the center of
+        the ellipse.
 
         Args:
             x:
-                X coordinate of the circle.
+                X coordinate of the ellipse.
             y:
-                Y coordinate of the circle.
-            radius:
-                The desired radius.
+                Y coordinate of the ellipse.
+            a:
+                Semi-major axes of the ellipse.
+            b:
+                Semi-minor axes of the ellipse.
             segments:
-                You can optionally specify how many distinct triangles
-                the circle should be made from. If not specified it will
-                be automatically calculated using the formula:
-                `max(14, int(radius / 1.25))`.
+                You can optionally specify how many distinct line segments
+                the ellipse should be made from. If not specified it will be
+                automatically calculated using the formula:
+                ``int(max(a, b) / 1.25)``.
             color:
-                The RGB or RGBA color of the circle, specified as a
+                The RGB or RGBA color of the ellipse, specified as a
                 tuple of 3 or 4 ints in the range of 0-255. RGB colors
                 will be treated as having an opacity of 255.
             blend_src:
@@ -62,80 +69,132 @@ class Circle(ShapeBase):
         self._x = x
         self._y = y
         self._z = 0.0
-        self._radius = radius
-        self._segments = segments or max(14, int(radius / 1.25))
-        r, g, b, *a = color
-        self._rgba = r, g, b, a[0] if a else 255
+        self._a = a
+        self._b = b
+
+        # Break with conventions in other _Shape constructors
+        # because a & b are used as meaningful variable names.
+        color_r, color_g, color_b, *color_a = color
+        self._rgba = color_r, color_g, color_b, color_a[0] if color_a else 255
+
+        self._rotation = 0
+        self._segments = segments or int(max(a, b) / 1.25)
 
         super().__init__(
-            self._segments * 3,
+            self._segments + 1,
             blend_src, blend_dest, batch, group, program,
         )
 
     def __contains__(self, point: tuple[float, float]) -> bool:
         assert len(point) == 2
-        return math.dist((self._x - self._anchor_x, self._y - self._anchor_y), point) < self._radius
+        px, py = _rotate_point((self._x, self._y), point, math.radians(self._rotation))
+        # Since directly testing whether a point is inside an ellipse is more
+        # complicated, it is more convenient to transform it into a circle.
+        dx = self._b / self._a * (px - self._x + self._anchor_x)
+        dy = py - self._y + self._anchor_y
+        return math.hypot(dx, dy) < self._b
+
+    def contains_points(self, points: Iterable[tuple[float, float]]) -> list[bool]:
+        """Test which of many points are inside the ellipse.
+
+        This gives the same results as using ``in`` with each point, but
+        computes the ellipse's rotation only once.
+
+        Args:
+            points:
+                The ``(x, y)`` points to test.
+        """
+        x = self._x
+        y = self._y
+        anchor_x = self._anchor_x
+        anchor_y = self._anchor_y
+        b = self._b
+        scale = b / self._a
+        angle = math.radians(self._rotation)
+        cos = math.cos(angle)
+        sin = math.sin(angle)
+        hypot = math.hypot
+
+        results = []
+        for px, py in points:
+            # Rotate the point around the position, as in _rotate_point.
+            dx = px - x
+            dy = py - y
+            rx = x + dx * cos - dy * sin
+            ry = y + dx * sin + dy * cos
+            results.append(hypot(scale * (rx - x + anchor_x), ry - y + anchor_y) < b)
+        return results
 
     def _create_vertex_list(self) -> None:
-        self._vertex_list = self._program.vertex_list(
-            self._segments * 3, self._draw_mode, self._batch, self._group,
+        self._vertex_list = self._program.vertex_list_indexed(
+            self._num_verts, self._draw_mode, _fan_indices(self._segments, True), self._batch, self._group,
             position=('f', self._get_vertices()),
             colors=('Bn', self._rgba * self._num_verts),
             translation=('f', (self._x, self._y) * self._num_verts))
 
     def _get_vertices(self) -> Sequence[float]:
         if not self._visible:
-            return (0, 0) * self._num_verts
+            return _hidden_vertices(self._num_verts)
 
         x = -self._anchor_x
         y = -self._anchor_y
-        r = self._radius
-        tau_segs = math.pi * 2 / self._segments
-
-        # Calculate the outer points of the circle:
-        points = [(x + (r * math.cos(i * tau_segs)),
-                   y + (r * math.sin(i * tau_segs))) for i in range(self._segments)]
+        a = self._a
+        b = self._b
+        cos, sin = _unit_ring(self._segments)
 
-        # Create a list of triangles from the points:
-        vertices = []
-        for i, point in enumerate(points):
-            triangle = x, y, *points[i - 1], *point
-            vertices.extend(triangle)
+        # Calculate the points of the ellipse by formula:
+        xs = [x + a * c for c in cos]
+        ys = [y + b * s for s in sin]
 
-        return vertices
+        # The center is followed by the outer points, which the indices join into triangles:
+        return [x, y, *chain.from_iterable(zip(xs, ys))]
 
     def _update_vertices(self) -> None:
+        if not self._visible and self._vertices_hidden:
+            # The hidden vertices are already uploaded.
+            return
+        self._vertices_hidden = not self._visible
         self._vertex_list.position[:] = self._get_vertices()
 
     @property
-    def radius(self) -> float:
-        """Gets/set radius of the circle."""
-        return self._radius
+    def a(self) -> float:
+        """Get/set the semi-major axes of the ellipse."""
+        return self._a
 
-    @radius.setter
-    def radius(self, value: float) -> None:
-        self._radius = value
+    @a.setter
+    def a(self, value: float) -> None:
+        self._a = value
+        self._update_vertices()
+
+    @property
+    def b(self) -> float:
+        """Get/set the semi-minor axes of the ellipse."""
+        return self._b
+
+    @b.setter
+    def b(self, value: float) -> None:
+        self._b = value
         self._update_vertices()
 
     @property
     def anchor_scale_x(self) -> float:
-        return self._anchor_x / self._radius
+        return self._anchor_x / self._a
     @anchor_scale_x.setter
     def anchor_scale_x(self, value: float) -> None:
-        self._anchor_x = self._radius * value
+        self._anchor_x = self._a * value
         self._update_vertices()
     
     @property
     def anchor_scale_y(self) -> float:
-        return self._anchor_y / self._radius
+        return self._anchor_y / self._b
     @anchor_scale_y.setter
     def anchor_scale_y(self, value: float) -> None:
-        self._anchor_y = self._radius * value
+        self._anchor_y = self._b * value
         self._update_vertices()
     
     def update(self,
                x: float | None = None, y: float | None = None, z: float | None = None,
-               radius: float | None = None,
+               a: float | None = None, b: float | None = None,
                anchor_x: float | None = None, anchor_y: float | None = None,
                anchor_scale_x: float | None = None, anchor_scale_y: float | None = None,
                visible: bool | None = None, rotation: float | None = None,
@@ -143,38 +202,41 @@ class Circle(ShapeBase):
         translation = False
         verticles = False
         
-        if x is not None:
+        if x is not None and x != self._x:
             self._x = x
             translation = True
-        if y is not None:
+        if y is not None and y != self._y:
             self._y = y
             translation = True
 
         if translation:
             self._update_translation()
 
-        if z is not None:
+        if z is not None and z != self._z:
             self.z = z
 
-        if radius is not None:
-            self._radius = radius
+        if a is not None and a != self._a:
+            self._a = a
+            verticles = True
+        if b is not None and b != self._b:
+            self._b = b
             verticles = True
         
-        if anchor_x is not None:
+        if anchor_x is not None and anchor_x != self._anchor_x:
             self._anchor_x = anchor_x
             verticles = True
-        if anchor_y is not None:
+        if anchor_y is not None and anchor_y != self._anchor_y:
             self._anchor_y = anchor_y
             verticles = True
 
         if anchor_scale_x is not None:
-            self._anchor_x = anchor_scale_x * self._radius
+            self._anchor_x = anchor_scale_x * self._a
             verticles = True
         if anchor_scale_y is not None:
-            self._anchor_y = anchor_scale_y * self._radius
+            self._anchor_y = anchor_scale_y * self._b
             verticles = True
 
-        if visible is not None:
+        if visible is not None and visible != self._visible:
             self._visible = visible
             verticles = True
 
@@ -182,27 +244,29 @@ class Circle(ShapeBase):
             self._update_vertices()
 
 
-        if rotation is not None:
+        if rotation is not None and rotation != self._rotation:
             self.rotation = rotation
 
 
         if color is not None:
             if opacity is not None:
-                self._rgba = (*color[:3], opacity)
+                rgba = (*color[:3], opacity)
             else:
-                self._rgba = (*color[:3], self._rgba[3])
-            self._update_color()
+                rgba = (*color[:3], self._rgba[3])
+            if rgba != self._rgba:
+                self._rgba = rgba
+                self._update_color()
 
-        elif opacity is not None:
+        elif opacity is not None and opacity != self._rgba[3]:
             self._rgba = (*self._rgba[:3], opacity)
             self._update_color()
 
 
-class Ellipse(ShapeBase):
+class Circle(Ellipse):
     def __init__(
             self,
             x: float, y: float,
-            a: float, b: float,
+            radius: float,
             segments: int | None = None,
             color: ColorValue = (255, 255, 255, 255),
             blend_src: int = GL_SRC_ALPHA,
@@ -211,27 +275,24 @@ class Ellipse(ShapeBase):
             group: Group | None = None,
             program: ShaderProgram | None = None,
     ) -> None:
-        """Create an ellipse.
+        """Create a circle.
 
-        The ellipse's anchor point ``(x, y)`` defaults to the center of
-        the ellipse.
+        The circle's anchor point (x, y) defaults to the center of the circle.
 
         Args:
             x:
-                X coordinate of the ellipse.
+                X coordinate of the circle.
             y:
-                Y coordinate of the ellipse.
-            a:
-                Semi-major axes of the ellipse.
-            b:
-                Semi-minor axes of the ellipse.
+                Y coordinate of the circle.
+            radius:
+                The desired radius.
             segments:
-                You can optionally specify how many distinct line segments
-                the ellipse should be made from. If not specified it will be
-                automatically calculated using the formula:
-                ``int(max(a, b) / 1.25)``.
+                You can optionally specify how many distinct triangles
+                the circle should be made from. If not specified it will
+                be automatically calculated using the formula:
+                `max(14, int(radius / 1.25))`.
             color:
-                The RGB or RGBA color of the ellipse, specified as a
+                The RGB or RGBA color of the circle, specified as a
                 tuple of 3 or 4 ints in the range of 0-255. RGB colors
                 will be treated as having an opacity of 255.
             blend_src:
@@ -245,169 +306,76 @@ class Ellipse(ShapeBase):
             program:
                 Optional shader program of the shape.
         """
-        self._x = x
-        self._y = y
-        self._z = 0.0
-        self._a = a
-        self._b = b
-
-        # Break with conventions in other _Shape constructors
-        # because a & b are used as meaningful variable names.
-        color_r, color_g, color_b, *color_a = color
-        self._rgba = color_r, color_g, color_b, color_a[0] if color_a else 255
-
-        self._rotation = 0
-        self._segments = segments or int(max(a, b) / 1.25)
-
         super().__init__(
-            self._segments * 3,
-            blend_src, blend_dest, batch, group, program,
+            x, y, radius, radius, segments or max(14, int(radius / 1.25)),
+            color, blend_src, blend_dest, batch, group, program,
         )
 
     def __contains__(self, point: tuple[float, float]) -> bool:
         assert len(point) == 2
-        point = _rotate_point((self._x, self._y), point, math.radians(self._rotation))
-        # Since directly testing whether a point is inside an ellipse is more
-        # complicated, it is more convenient to transform it into a circle.
-        point = (self._b / self._a * point[0], point[1])
-        shape_center = (self._b / self._a * (self._x - self._anchor_x), self._y - self._anchor_y)
-        return math.dist(shape_center, point) < self._b
+        return math.hypot(point[0] - self._x + self._anchor_x, point[1] - self._y + self._anchor_y) < self._a
 
-    def _create_vertex_list(self) -> None:
-        self._vertex_list = self._program.vertex_list(
-            self._segments * 3, self._draw_mode, self._batch, self._group,
-            position=('f', self._get_vertices()),
-            colors=('Bn', self._rgba * self._num_verts),
-            translation=('f', (self._x, self._y) * self._num_verts))
+    def contains_points(self, points: Iterable[tuple[float, float]]) -> list[bool]:
+        """Test which of many points are inside the circle.
 
-    def _get_vertices(self) -> Sequence[float]:
-        if not self._visible:
-            return (0, 0) * self._num_verts
+        This gives the same results as using ``in`` with each point, but
+        looks up the circle's position and radius only once.
 
-        x = -self._anchor_x
-        y = -self._anchor_y
-        tau_segs = math.pi * 2 / self._segments
-
-        # Calculate the points of the ellipse by formula:
-        points = [(x + self._a * math.cos(i * tau_segs),
-                   y + self._b * math.sin(i * tau_segs)) for i in range(self._segments)]
-
-        # Create a list of triangles from the points:
-        vertices = []
-        for i, point in enumerate(points):
-            triangle = x, y, *points[i - 1], *point
-            vertices.extend(triangle)
+        Args:
+            points:
+                The ``(x, y)`` points to test.
+        """
+        x = self._x
+        y = self._y
+        anchor_x = self._anchor_x
+        anchor_y = self._anchor_y
+        r = self._a
+        hypot = math.hypot
+        return [hypot(px - x + anchor_x, py - y + anchor_y) < r for px, py in points]
 
-        return vertices
+    @property
+    def radius(self) -> float:
+        """Gets/set radius of the circle."""
+        return self._a
 
-    def _update_vertices(self) -> None:
-        self._vertex_list.position[:] = self._get_vertices()
+    @radius.setter
+    def radius(self, value: float) -> None:
+        self._a = self._b = value
+        self._update_vertices()
 
     @property
     def a(self) -> float:
-        """Get/set the semi-major axes of the ellipse."""
+        """Get/set the radius of the circle, the same as ``radius``."""
         return self._a
 
     @a.setter
     def a(self, value: float) -> None:
-        self._a = value
-        self._update_vertices()
+        self.radius = value
 
     @property
     def b(self) -> float:
-        """Get/set the semi-minor axes of the ellipse."""
+        """Get/set the radius of the circle, the same as ``radius``."""
         return self._b
 
     @b.setter
     def b(self, value: float) -> None:
-        self._b = value
-        self._update_vertices()
+        self.radius = value
 
-    @property
-    def anchor_scale_x(self) -> float:
-        return self._anchor_x / self._a
-    @anchor_scale_x.setter
-    def anchor_scale_x(self, value: float) -> None:
-        self._anchor_x = self._a * value
-        self._update_vertices()
-    
-    @property
-    def anchor_scale_y(self) -> float:
-        return self._anchor_y / self._b
-    @anchor_scale_y.setter
-    def anchor_scale_y(self, value: float) -> None:
-        self._anchor_y = self._b * value
-        self._update_vertices()
-    
     def update(self,
                x: float | None = None, y: float | None = None, z: float | None = None,
-               a: float | None = None, b: float | None = None,
+               radius: float | None = None,
                anchor_x: float | None = None, anchor_y: float | None = None,
                anchor_scale_x: float | None = None, anchor_scale_y: float | None = None,
                visible: bool | None = None, rotation: float | None = None,
                color: ColorValue | None = None, opacity: float | None = None) -> None:
-        translation = False
-        verticles = False
-        
-        if x is not None:
-            self._x = x
-            translation = True
-        if y is not None:
-            self._y = y
-            translation = True
-
-        if translation:
-            self._update_translation()
-
-        if z is not None:
-            self.z = z
-
-        if a is not None:
-            self._a = a
-            verticles = True
-        if b is not None:
-            self._b = b
-            verticles = True
-        
-        if anchor_x is not None:
-            self._anchor_x = anchor_x
-            verticles = True
-        if anchor_y is not None:
-            self._anchor_y = anchor_y
-            verticles = True
-
-        if anchor_scale_x is not None:
-            self._anchor_x = anchor_scale_x * self._a
-            verticles = True
-        if anchor_scale_y is not None:
-            self._anchor_y = anchor_scale_y * self._b
-            verticles = True
-
-        if visible is not None:
-            self._visible = visible
-            verticles = True
-
-        if verticles:
-            self._update_vertices()
-
-
-        if rotation is not None:
-            self.rotation = rotation
-
-
-        if color is not None:
-            if opacity is not None:
-                self._rgba = (*color[:3], opacity)
-            else:
-                self._rgba = (*color[:3], self._rgba[3])
-            self._update_color()
-
-        elif opacity is not None:
-            self._rgba = (*self._rgba[:3], opacity)
-            self._update_color()
+        super().update(x, y, z, radius, radius, anchor_x, anchor_y, anchor_scale_x, anchor_scale_y,
+                       visible, rotation, color, opacity)
 
 
 class Sector(ShapeBase):
+    # Whether the uploaded vertices are the collapsed ones of a hidden shape.
+    _vertices_hidden: bool = False
+
     def __init__(
             self,
             x: float, y: float,
@@ -474,50 +442,92 @@ class Sector(ShapeBase):
         self._rotation = 0
 
         super().__init__(
-            self._segments * 3,
+            self._segments + 2,
             blend_src, blend_dest, batch, group, program,
         )
 
     def __contains__(self, point: tuple[float, float]) -> bool:
         assert len(point) == 2
-        point = _rotate_point((self._x, self._y), point, math.radians(self._rotation))
-        angle = math.atan2(point[1] - self._y + self._anchor_y, point[0] - self._x + self._anchor_x)
+        px, py = _rotate_point((self._x, self._y), point, math.radians(self._rotation))
+        dx = px - self._x + self._anchor_x
+        dy = py - self._y + self._anchor_y
+        angle = math.atan2(dy, dx)
         if angle < 0:
             angle += 2 * math.pi
         if self._start_angle < angle < self._start_angle + self._angle:
-            return math.dist((self._x - self._anchor_x, self._y - self._anchor_y), point) < self._radius
+            return math.hypot(dx, dy) < self._radius
         return False
 
+    def contains_points(self, points: Iterable[tuple[float, float]]) -> list[bool]:
+        """Test which of many points are inside the sector.
+
+        This gives the same results as using ``in`` with each point, but
+        computes the sector's rotation only once.
+
+        Args:
+            points:
+                The ``(x, y)`` points to test.
+        """
+        x = self._x
+        y = self._y
+        anchor_x = self._anchor_x
+        anchor_y = self._anchor_y
+        r = self._radius
+        start_angle = self._start_angle
+        end_angle = self._start_angle + self._angle
+        angle = math.radians(self._rotation)
+        cos = math.cos(angle)
+        sin = math.sin(angle)
+        tau = 2 * math.pi
+        atan2 = math.atan2
+        hypot = math.hypot
+
+        results = []
+        for px, py in points:
+            # Rotate the point around the position, as in _rotate_point.
+            dx = px - x
+            dy = py - y
+            rx = x + dx * cos - dy * sin
+            ry = y + dx * sin + dy * cos
+            dx = rx - x + anchor_x
+            dy = ry - y + anchor_y
+            point_angle = atan2(dy, dx)
+            if point_angle < 0:
+                point_angle += tau
+            results.append(start_angle < point_angle < end_angle and hypot(dx, dy) < r)
+        return results
+
     def _create_vertex_list(self) -> None:
-        self._vertex_list = self._program.vertex_list(
-            self._num_verts, self._draw_mode, self._batch, self._group,
+        self._vertex_list = self._program.vertex_list_indexed(
+            self._num_verts, self._draw_mode, _fan_indices(self._segments, False), self._batch, self._group,
             position=('f', self._get_vertices()),
             colors=('Bn', self._rgba * self._num_verts),
             translation=('f', (self._x, self._y) * self._num_verts))
 
     def _get_vertices(self) -> Sequence[float]:
         if not self._visible:
-            return (0, 0) * self._num_verts
+            return _hidden_vertices(self._num_verts)
 
         x = -self._anchor_x
         y = -self._anchor_y
         r = self._radius
-        segment_radians = math.radians(self._angle) / self._segments
         start_radians = math.radians(self._start_angle - self._rotation)
+        cos, sin = _unit_arc(self._segments, math.radians(self._angle))
 
-        # Calculate the outer points of the sector.
-        points = [(x + (r * math.cos((i * segment_radians) + start_radians)),
-                   y + (r * math.sin((i * segment_radians) + start_radians))) for i in range(self._segments + 1)]
-
-        # Create a list of triangles from the points
-        vertices = []
-        for i, point in enumerate(points[1:], start=1):
-            triangle = x, y, *points[i - 1], *point
-            vertices.extend(triangle)
+        # Calculate the outer points of the sector, rotating the arc to its start angle.
+        rc = r * math.cos(start_radians)
+        rs = r * math.sin(start_radians)
+        xs = [x + rc * c - rs * s for c, s in zip(cos, sin)]
+        ys = [y + rs * c + rc * s for c, s in zip(cos, sin)]
 
-        return vertices
+        # The center is followed by the outer points, which the indices join into triangles:
+        return [x, y, *chain.from_iterable(zip(xs, ys))]
 
     def _update_vertices(self) -> None:
+        if not self._visible and self._vertices_hidden:
+            # The hidden vertices are already uploaded.
+            return
+        self._vertices_hidden = not self._visible
         self._vertex_list.position[:] = self._get_vertices()
 
     @property
@@ -563,38 +573,38 @@ class Sector(ShapeBase):
         translation = False
         verticles = False
         
-        if x is not None:
+        if x is not None and x != self._x:
             self._x = x
             translation = True
-        if y is not None:
+        if y is not None and y != self._y:
             self._y = y
             translation = True
 
         if translation:
             self._update_translation()
 
-        if z is not None:
+        if z is not None and z != self._z:
             self.z = z
 
-        if radius is not None:
+        if radius is not None and radius != self._radius:
             self._radius = radius
             verticles = True
         
-        if start_angle is not None:
+        if start_angle is not None and start_angle != self._start_angle:
             self._start_angle = start_angle
             verticles = True
-        if angle is not None:
+        if angle is not None and angle != self._angle:
             self._angle = angle
             verticles = True
         
-        if anchor_x is not None:
+        if anchor_x is not None and anchor_x != self._anchor_x:
             self._anchor_x = anchor_x
             verticles = True
-        if anchor_y is not None:
+        if anchor_y is not None and anchor_y != self._anchor_y:
             self._anchor_y = anchor_y
             verticles = True
 
-        if visible is not None:
+        if visible is not None and visible != self._visible:
             self._visible = visible
             verticles = True
 
@@ -602,17 +612,19 @@ class Sector(ShapeBase):
             self._update_vertices()
 
 
-        if rotation is not None:
+        if rotation is not None and rotation != self._rotation:
             self.rotation = rotation
 
 
         if color is not None:
             if opacity is not None:
-                self._rgba = (*color[:3], opacity)
+                rgba = (*color[:3], opacity)
             else:
-                self._rgba = (*color[:3], self._rgba[3])
-            self._update_color()
+                rgba = (*color[:3], self._rgba[3])
+            if rgba != self._rgba:
+                self._rgba = rgba
+                self._update_color()
 
-        elif opacity is not None:
+        elif opacity is not None and opacity != self._rgba[3]:
             self._rgba = (*self._rgba[:3], opacity)
             self._update_color()
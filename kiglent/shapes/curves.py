@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import math
+from functools import lru_cache
+from operator import mul
 from typing import TYPE_CHECKING, Sequence
 
-from kiglent.shapes import ShapeBase, _get_segment
+from kiglent.shapes import ShapeBase, _get_path_vertices, _hidden_vertices, _unit_arc
 from kiglent.gl import GL_ONE_MINUS_SRC_ALPHA, GL_SRC_ALPHA
 from kiglent.vector import Vec2
 
@@ -16,7 +18,40 @@ if TYPE_CHECKING:
 __all__ = ['Arc', 'BezierCurve']
 
 
+@lru_cache(maxsize=64)
+def _bezier_basis(degree: int, segments: int, t: float) -> tuple[tuple[float, ...], ...]:
+    """Get the Bernstein weights of each control point, for ``segments + 1`` samples of a curve drawn up to ``t``.
+
+    The weights only depend on the curve's degree and sampling, so curves
+    that only move their control points can reuse them.
+    """
+    # Each binomial coefficient follows from the one before it:
+    binomials = [1]
+    for i in range(degree):
+        binomials.append(binomials[-1] * (degree - i) // (i + 1))
+
+    basis = []
+    for step in range(segments + 1):
+        s = t * step / segments
+        u = 1 - s
+        weights = list(binomials)
+        # Multiply in the powers of s counting up, and of u counting down:
+        power = 1.0
+        for i in range(1, degree + 1):
+            power *= s
+            weights[i] *= power
+        power = 1.0
+        for i in range(degree - 1, -1, -1):
+            power *= u
+            weights[i] *= power
+        basis.append(tuple(weights))
+    return tuple(basis)
+
+
 class Arc(ShapeBase):
+    # Whether the uploaded vertices are the collapsed ones of a hidden shape.
+    _vertices_hidden: bool = False
+
     def __init__(
             self,
             x: float, y: float,
@@ -48,7 +83,7 @@ class Arc(ShapeBase):
                 You can optionally specify how many distinct line segments
                 the arc should be made from. If not specified it will be
                 automatically calculated using the formula:
-                ``max(14, int(radius / 1.25))``.
+                ``max(14, min(int(radius / 1.25), int(7 * math.sqrt(radius))))``.
             angle:
                 The angle of the arc, in degrees. Defaults to 360.0, which is
                 a full circle.
@@ -78,7 +113,9 @@ class Arc(ShapeBase):
         self._y = y
         self._z = 0.0
         self._radius = radius
-        self._segments = segments or max(14, int(radius / 1.25))
+        # Past a radius of about 80, the count grows with the square root of the radius,
+        # which keeps each segment within about 0.1 pixels of the true circle.
+        self._segments = segments or max(14, min(int(radius / 1.25), int(7 * math.sqrt(radius))))
 
         # handle both 3 and 4 byte colors
         r, g, b, *a = color
@@ -87,8 +124,8 @@ class Arc(ShapeBase):
         self._thickness = thickness
         self._angle = angle
         self._start_angle = start_angle
-        # Only set closed if the angle isn't tau
-        self._closed = closed if abs(math.tau - self._angle) > 1e-9 else False
+        # Only set closed if the arc isn't a full circle
+        self._closed = closed and not self._is_full_circle()
         self._rotation = 0
 
         super().__init__(
@@ -106,58 +143,46 @@ class Arc(ShapeBase):
 
     def _get_vertices(self) -> Sequence[float]:
         if not self._visible:
-            return (0, 0) * self._num_verts
+            return _hidden_vertices(self._num_verts)
 
         x = -self._anchor_x
         y = -self._anchor_y
         r = self._radius
-        segment_radians = math.radians(self._angle) / self._segments
         start_radians = math.radians(self._start_angle - self._rotation)
+        rc = r * math.cos(start_radians)
+        rs = r * math.sin(start_radians)
+        cos, sin = _unit_arc(self._segments, math.radians(self._angle))
 
-        # Calculate the outer points of the arc:
-        points = [(x + (r * math.cos((i * segment_radians) + start_radians)),
-                   y + (r * math.sin((i * segment_radians) + start_radians))) for i in range(self._segments + 1)]
+        # Calculate the outer points of the arc, rotating the unit arc to the start angle:
+        points = [(x + rc * c - rs * s, y + rs * c + rc * s) for c, s in zip(cos, sin)]
 
         # Create a list of quads from the points
-        vertices = []
-        prev_miter = None
-        prev_scale = None
-        for i in range(len(points) - 1):
-            prev_point = None
-            next_point = None
-            if i > 0:
-                prev_point = points[i - 1]
-            elif self._closed:
-                prev_point = points[-1]
-            elif abs(self._angle - math.tau) <= 1e-9:
-                prev_point = points[-2]
-
-            if i + 2 < len(points):
-                next_point = points[i + 2]
-            elif self._closed:
-                next_point = points[0]
-            elif abs(self._angle - math.tau) <= 1e-9:
-                next_point = points[1]
-
-            prev_miter, prev_scale, *segment = _get_segment(prev_point, points[i], points[i + 1], next_point,
-                                                            self._thickness, prev_miter, prev_scale)
-            vertices.extend(segment)
-
+        prev_point = None
+        next_point = None
         if self._closed:
-            prev_point = None
-            next_point = None
+            # The ends are joined by one more segment, back to the first point.
+            prev_point = points[-1]
             if len(points) > 2:
-                prev_point = points[-2]
                 next_point = points[1]
-            prev_miter, prev_scale, *segment = _get_segment(prev_point, points[-1], points[0], next_point,
-                                                            self._thickness, prev_miter, prev_scale)
-            vertices.extend(segment)
+            points.append(points[0])
+        elif self._is_full_circle():
+            # The ends meet, so they are mitered against each other.
+            prev_point = points[-2]
+            next_point = points[1]
 
-        return vertices
+        return _get_path_vertices(points, self._thickness, prev_point, next_point)
 
     def _update_vertices(self) -> None:
+        if not self._visible and self._vertices_hidden:
+            # The hidden vertices are already uploaded.
+            return
+        self._vertices_hidden = not self._visible
         self._vertex_list.position[:] = self._get_vertices()
 
+    def _is_full_circle(self) -> bool:
+        # The angle is in degrees, and may be negative.
+        return abs(abs(self._angle) - 360.0) <= 1e-9
+
     @property
     def radius(self) -> float:
         """Get/set the radius of the arc."""
@@ -165,6 +190,8 @@ class Arc(ShapeBase):
 
     @radius.setter
     def radius(self, value: float) -> None:
+        if value == self._radius:
+            return
         self._radius = value
         self._update_vertices()
 
@@ -175,6 +202,8 @@ class Arc(ShapeBase):
 
     @thickness.setter
     def thickness(self, thickness: float) -> None:
+        if thickness == self._thickness:
+            return
         self._thickness = thickness
         self._update_vertices()
 
@@ -185,6 +214,8 @@ class Arc(ShapeBase):
 
     @angle.setter
     def angle(self, value: float) -> None:
+        if value == self._angle:
+            return
         self._angle = value
         self._update_vertices()
 
@@ -195,6 +226,8 @@ class Arc(ShapeBase):
 
     @start_angle.setter
     def start_angle(self, angle: float) -> None:
+        if angle == self._start_angle:
+            return
         self._start_angle = angle
         self._update_vertices()
     
@@ -209,46 +242,46 @@ class Arc(ShapeBase):
         translation = False
         verticles = False
         
-        if x is not None:
+        if x is not None and x != self._x:
             self._x = x
             translation = True
-        if y is not None:
+        if y is not None and y != self._y:
             self._y = y
             translation = True
 
         if translation:
             self._update_translation()
 
-        if z is not None:
+        if z is not None and z != self._z:
             self.z = z
 
-        if radius is not None:
+        if radius is not None and radius != self._radius:
             self._radius = radius
             verticles = True
         
-        if start_angle is not None:
+        if start_angle is not None and start_angle != self._start_angle:
             self._start_angle = start_angle
             verticles = True
-        if angle is not None:
+        if angle is not None and angle != self._angle:
             self._angle = angle
             verticles = True
         
-        if closed is not None:
+        if closed is not None and closed != self._closed:
             self._closed = closed
             verticles = True
         
-        if thickness is not None:
+        if thickness is not None and thickness != self._thickness:
             self._thickness = thickness
             verticles = True
         
-        if anchor_x is not None:
+        if anchor_x is not None and anchor_x != self._anchor_x:
             self._anchor_x = anchor_x
             verticles = True
-        if anchor_y is not None:
+        if anchor_y is not None and anchor_y != self._anchor_y:
             self._anchor_y = anchor_y
             verticles = True
 
-        if visible is not None:
+        if visible is not None and visible != self._visible:
             self._visible = visible
             verticles = True
 
@@ -256,23 +289,28 @@ class Arc(ShapeBase):
             self._update_vertices()
 
 
-        if rotation is not None:
+        if rotation is not None and rotation != self._rotation:
             self.rotation = rotation
 
 
         if color is not None:
             if opacity is not None:
-                self._rgba = (*color[:3], opacity)
+                rgba = (*color[:3], opacity)
             else:
-                self._rgba = (*color[:3], self._rgba[3])
-            self._update_color()
+                rgba = (*color[:3], self._rgba[3])
+            if rgba != self._rgba:
+                self._rgba = rgba
+                self._update_color()
 
-        elif opacity is not None:
+        elif opacity is not None and opacity != self._rgba[3]:
             self._rgba = (*self._rgba[:3], opacity)
             self._update_color()
 
 
 class BezierCurve(ShapeBase):
+    # Whether the uploaded vertices are the collapsed ones of a hidden shape.
+    _vertices_hidden: bool = False
+
     def __init__(
             self,
             *points: tuple[float, float],
@@ -319,6 +357,7 @@ class BezierCurve(ShapeBase):
         """
         self._points = list(points)
         self._x, self._y = self._points[0]
+        self._relative_points = self._get_relative_points(self._points)
         self._t = t
         self._segments = segments
         self._thickness = thickness
@@ -330,15 +369,6 @@ class BezierCurve(ShapeBase):
             blend_src, blend_dest, batch, group, program,
         )
 
-    def _make_curve(self, t: float) -> list[float]:
-        n = len(self._points) - 1
-        p = [0, 0]
-        for i in range(n + 1):
-            m = math.comb(n, i) * (1 - t) ** (n - i) * t ** i
-            p[0] += m * self._points[i][0]
-            p[1] += m * self._points[i][1]
-        return p
-
     def _create_vertex_list(self) -> None:
         self._vertex_list = self._program.vertex_list(
             self._num_verts, self._draw_mode, self._batch, self._group,
@@ -348,40 +378,51 @@ class BezierCurve(ShapeBase):
 
     def _get_vertices(self) -> Sequence[float]:
         if not self._visible:
-            return (0, 0) * self._num_verts
+            return _hidden_vertices(self._num_verts)
 
-        x = -self._anchor_x - self._x
-        y = -self._anchor_y - self._y
+        x = -self._anchor_x
+        y = -self._anchor_y
 
-        # Calculate the points of the curve:
-        points = [(x + self._make_curve(self._t * t / self._segments)[0],
-                   y + self._make_curve(self._t * t / self._segments)[1]) for t in range(self._segments + 1)]
-        trans_x, trans_y = points[0]
-        trans_x += self._anchor_x
-        trans_y += self._anchor_y
-        coords = [[x - trans_x, y - trans_y] for x, y in points]
+        # Calculate the points of the curve as weighted sums of the control points:
+        xs = [point[0] for point in self._relative_points]
+        ys = [point[1] for point in self._relative_points]
+        basis = _bezier_basis(len(xs) - 1, self._segments, self._t)
+        points = [(x + sum(map(mul, weights, xs)), y + sum(map(mul, weights, ys))) for weights in basis]
 
         # Create a list of doubled-up points from the points:
-        vertices = []
-        prev_miter = None
-        prev_scale = None
-        for i in range(len(coords) - 1):
-            prev_point = None
-            next_point = None
-            if i > 0:
-                prev_point = points[i - 1]
+        return _get_path_vertices(points, self._thickness)
+
+    def _update_vertices(self) -> None:
+        if not self._visible and self._vertices_hidden:
+            # The hidden vertices are already uploaded.
+            return
+        self._vertices_hidden = not self._visible
+        self._vertex_list.position[:] = self._get_vertices()
 
-            if i + 2 < len(points):
-                next_point = points[i + 2]
+    @staticmethod
+    def _get_relative_points(points: Sequence[tuple[float, float]]) -> list[tuple[float, float]]:
+        """Get the control points relative to the first one, which the vertices are built from."""
+        x, y = points[0]
+        return [(px - x, py - y) for px, py in points]
 
-            prev_miter, prev_scale, *segment = _get_segment(prev_point, points[i], points[i + 1], next_point,
-                                                            self._thickness, prev_miter, prev_scale)
-            vertices.extend(segment)
+    def _move_points(self, points: Sequence[tuple[float, float]]) -> bool:
+        """Move the curve's position to the first of the new control points.
 
-        return vertices
+        Returns whether the vertices need to be rebuilt. They don't when the
+        points have all moved by the same offset, as only the translation
+        changes then.
+        """
+        x, y = points[0]
+        if x != self._x or y != self._y:
+            self._x = x
+            self._y = y
+            self._update_translation()
 
-    def _update_vertices(self) -> None:
-        self._vertex_list.position[:] = self._get_vertices()
+        relative_points = self._get_relative_points(points)
+        if relative_points == self._relative_points:
+            return False
+        self._relative_points = relative_points
+        return True
 
     @property
     def points(self) -> list[tuple[float, float]]:
@@ -391,7 +432,8 @@ class BezierCurve(ShapeBase):
     @points.setter
     def points(self, value: list[tuple[float, float]]) -> None:
         self._points = value
-        self._update_vertices()
+        if self._move_points(value):
+            self._update_vertices()
 
     @property
     def t(self) -> float:
@@ -400,6 +442,8 @@ class BezierCurve(ShapeBase):
 
     @t.setter
     def t(self, value: float) -> None:
+        if value == self._t:
+            return
         self._t = value
         self._update_vertices()
 
@@ -410,6 +454,8 @@ class BezierCurve(ShapeBase):
 
     @thickness.setter
     def thickness(self, thickness: float) -> None:
+        if thickness == self._thickness:
+            return
         self._thickness = thickness
         self._update_vertices()
 
@@ -422,34 +468,30 @@ class BezierCurve(ShapeBase):
                color: ColorValue | None = None, opacity: float | None = None) -> None:
         verticles = False
         
-        if t is not None:
+        if t is not None and t != self._t:
             self._t = t
             verticles = True
         
         if points is not None:
-            x, y =points[0]
-            self._x = x
-            self._y = y
-            self._update_translation()
-            
             self._points = list(points)
-            verticles = True
+            if self._move_points(self._points):
+                verticles = True
 
-        if z is not None:
+        if z is not None and z != self._z:
             self.z = z
         
-        if thickness is not None:
+        if thickness is not None and thickness != self._thickness:
             self._thickness = thickness
             verticles = True
         
-        if anchor_x is not None:
+        if anchor_x is not None and anchor_x != self._anchor_x:
             self._anchor_x = anchor_x
             verticles = True
-        if anchor_y is not None:
+        if anchor_y is not None and anchor_y != self._anchor_y:
             self._anchor_y = anchor_y
             verticles = True
 
-        if visible is not None:
+        if visible is not None and visible != self._visible:
             self._visible = visible
             verticles = True
 
@@ -457,18 +499,20 @@ class BezierCurve(ShapeBase):
             self._update_vertices()
 
 
-        if rotation is not None:
+        if rotation is not None and rotation != self._rotation:
             self.rotation = rotation
 
 
         if color is not None:
             if opacity is not None:
-                self._rgba = (*color[:3], opacity)
+                rgba = (*color[:3], opacity)
             else:
-                self._rgba = (*color[:3], self._rgba[3])
-            self._update_color()
+                rgba = (*color[:3], self._rgba[3])
+            if rgba != self._rgba:
+                self._rgba = rgba
+                self._update_color()
 
-        elif opacity is not None:
+        elif opacity is not None and opacity != self._rgba[3]:
             self._rgba = (*self._rgba[:3], opacity)
             self._update_color()
 
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import math
-from typing import TYPE_CHECKING, Sequence
+import sys
+from fractions import Fraction
+from itertools import chain
+from typing import TYPE_CHECKING, Iterable, Sequence
 
-from kiglent.shapes import ShapeBase, _rotate_point
+from kiglent.shapes import ShapeBase, _fan_indices, _rotate_point, _unit_ring
 from kiglent.shapes import extra_earcut as earcut
 from kiglent.gl import GL_ONE_MINUS_SRC_ALPHA, GL_SRC_ALPHA
 
@@ -16,25 +19,104 @@ if TYPE_CHECKING:
 __all__ = ['Triangle', 'Star', 'Polygon']
 
 
+# Bound on the rounding error of the orientation determinant, relative to the sum of its two products,
+# from Shewchuk's "Adaptive Precision Floating-Point Arithmetic and Fast Robust Geometric Predicates".
+_EPSILON = sys.float_info.epsilon / 2
+_ORIENT_ERROR_BOUND = (3.0 + 16.0 * _EPSILON) * _EPSILON
+
+
+def _orient2d(ax: float, ay: float, bx: float, by: float, cx: float, cy: float) -> float:
+    """Get twice the signed area of the triangle ``a, b, c``.
+
+    The result is positive when the points are in counter-clockwise order,
+    negative when clockwise, and 0 when they are on one line. Its sign is
+    always exact: when rounding could have flipped it, the sign is found
+    with exact rational arithmetic instead, and only that sign is returned.
+    """
+    left = (ax - cx) * (by - cy)
+    right = (ay - cy) * (bx - cx)
+    det = left - right
+    if abs(det) >= _ORIENT_ERROR_BOUND * (abs(left) + abs(right)):
+        return det
+
+    ax, ay, bx, by, cx, cy = map(Fraction, (ax, ay, bx, by, cx, cy))
+    exact = (ax - cx) * (by - cy) - (ay - cy) * (bx - cx)
+    return float((exact > 0) - (exact < 0))
+
+
 def _point_in_polygon(polygon: Sequence[tuple[float, float]], point: tuple[float, float]) -> bool:
     """Use raycasting to determine if a point is inside a polygon.
 
-    This function is an example implementation available under MIT License at:
+    The polygon's points are not closed: the last point connects back to the first.
+
+    This function is adapted from an example implementation available under MIT License at:
     https://www.algorithms-and-technologies.com/point_in_polygon/python
     """
+    px, py = point
     odd = False
-    i = 0
-    j = len(polygon) - 1
-    while i < len(polygon) - 1:
-        i = i + 1
-        if ((polygon[i][1] > point[1]) != (polygon[j][1] > point[1])) and (
-                point[0] < ((polygon[j][0] - polygon[i][0]) * (point[1] - polygon[i][1])
-                          / (polygon[j][1] - polygon[i][1])) + polygon[i][0]):
-            odd = not odd
-        j = i
+    xj, yj = polygon[-1]
+    for xi, yi in polygon:
+        if (yi > py) != (yj > py):
+            # The point is left of an upward edge, or right of a downward one, when the ray crosses it.
+            # This is _orient2d's floating point check inlined, as it almost always decides the sign.
+            left = (xi - px) * (yj - py)
+            right = (yi - py) * (xj - px)
+            orientation = left - right
+            if abs(orientation) < _ORIENT_ERROR_BOUND * (abs(left) + abs(right)):
+                orientation = _orient2d(xi, yi, xj, yj, px, py)
+            if (orientation > 0) if yj > yi else (orientation < 0):
+                odd = not odd
+        xj, yj = xi, yi
     return odd
 
 
+def _get_bounds(points: Sequence[tuple[float, float]]) -> tuple[float, float, float, float]:
+    """Get the ``(min_x, min_y, max_x, max_y)`` bounding box of some points."""
+    xs = [point[0] for point in points]
+    ys = [point[1] for point in points]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _get_shape(coordinates: Sequence[tuple[float, float]]) -> list[float]:
+    """Get the flattened coordinates relative to the first point."""
+    x0, y0 = coordinates[0]
+    shape = []
+    for x, y in coordinates:
+        shape += (x - x0, y - y0)
+    return shape
+
+
+def _points_in_polygon(polygon: Sequence[tuple[float, float]], points: Iterable[tuple[float, float]]) -> list[bool]:
+    """Use raycasting to determine which of many points are inside a polygon.
+
+    This gives the same results as :py:func:`_point_in_polygon` for each point,
+    but unpacks the polygon's edges only once.
+    """
+    # Each edge runs from the previous point (j) to the current one (i), as in _point_in_polygon.
+    edges = [(xi, yi, xj, yj, yj > yi)
+             for (xj, yj), (xi, yi) in zip([polygon[-1], *polygon[:-1]], polygon)]
+    min_x, min_y, max_x, max_y = _get_bounds(polygon)
+
+    results = []
+    for px, py in points:
+        if not (min_x <= px <= max_x and min_y <= py <= max_y):
+            # A ray from a point outside the bounding box crosses no edges, or all of them.
+            results.append(False)
+            continue
+        odd = False
+        for xi, yi, xj, yj, upward in edges:
+            if (yi > py) != (yj > py):
+                left = (xi - px) * (yj - py)
+                right = (yi - py) * (xj - px)
+                orientation = left - right
+                if abs(orientation) < _ORIENT_ERROR_BOUND * (abs(left) + abs(right)):
+                    orientation = _orient2d(xi, yi, xj, yj, px, py)
+                if (orientation > 0) if upward else (orientation < 0):
+                    odd = not odd
+        results.append(odd)
+    return results
+
+
 class Triangle(ShapeBase):
     def __init__(
             self,
@@ -96,8 +178,19 @@ class Triangle(ShapeBase):
 
     def __contains__(self, point: tuple[float, float]) -> bool:
         assert len(point) == 2
-        return _point_in_polygon(
-            [(self._x, self._y), (self._x2, self._y2), (self._x3, self._y3), (self._x, self._y)], point)
+        return _point_in_polygon([(self._x, self._y), (self._x2, self._y2), (self._x3, self._y3)], point)
+
+    def contains_points(self, points: Iterable[tuple[float, float]]) -> list[bool]:
+        """Test which of many points are inside the triangle.
+
+        This gives the same results as using ``in`` with each point, but
+        unpacks the triangle's edges only once.
+
+        Args:
+            points:
+                The ``(x, y)`` points to test.
+        """
+        return _points_in_polygon([(self._x, self._y), (self._x2, self._y2), (self._x3, self._y3)], points)
 
     def _create_vertex_list(self) -> None:
         self._vertex_list = self._program.vertex_list(
@@ -121,6 +214,12 @@ class Triangle(ShapeBase):
     def _update_vertices(self) -> None:
         self._vertex_list.position[:] = self._get_vertices()
 
+    def _update_vertex(self, index: int, x: float, y: float) -> None:
+        # Write only the vertex that moved, matching the values _get_vertices would give.
+        if self._visible:
+            self._vertex_list.position[index * 2:index * 2 + 2] = (
+                x - self._anchor_x - self._x, y - self._anchor_y - self._y)
+
     @property
     def x2(self) -> float:
         """Get/set the X coordinate of the triangle's 2nd vertex."""
@@ -128,8 +227,10 @@ class Triangle(ShapeBase):
 
     @x2.setter
     def x2(self, value: float) -> None:
+        if value == self._x2:
+            return
         self._x2 = value
-        self._update_vertices()
+        self._update_vertex(1, self._x2, self._y2)
 
     @property
     def y2(self) -> float:
@@ -138,8 +239,10 @@ class Triangle(ShapeBase):
 
     @y2.setter
     def y2(self, value: float) -> None:
+        if value == self._y2:
+            return
         self._y2 = value
-        self._update_vertices()
+        self._update_vertex(1, self._x2, self._y2)
 
     @property
     def x3(self) -> float:
@@ -148,8 +251,10 @@ class Triangle(ShapeBase):
 
     @x3.setter
     def x3(self, value: float) -> None:
+        if value == self._x3:
+            return
         self._x3 = value
-        self._update_vertices()
+        self._update_vertex(2, self._x3, self._y3)
 
     @property
     def y3(self) -> float:
@@ -158,8 +263,10 @@ class Triangle(ShapeBase):
 
     @y3.setter
     def y3(self, value: float) -> None:
+        if value == self._y3:
+            return
         self._y3 = value
-        self._update_vertices()
+        self._update_vertex(2, self._x3, self._y3)
 
     def update(self,
                x: float | None = None, y: float | None = None, z: float | None = None,
@@ -171,40 +278,40 @@ class Triangle(ShapeBase):
         translation = False
         verticles = False
         
-        if x is not None:
+        if x is not None and x != self._x:
             self._x = x
             translation = True
-        if y is not None:
+        if y is not None and y != self._y:
             self._y = y
             translation = True
 
         if translation:
             self._update_translation()
 
-        if z is not None:
+        if z is not None and z != self._z:
             self.z = z
         
-        if x2 is not None:
+        if x2 is not None and x2 != self._x2:
             self._x2 = x2
             verticles = True
-        if y2 is not None:
+        if y2 is not None and y2 != self._y2:
             self._y2 = y2
             verticles = True
-        if x3 is not None:
+        if x3 is not None and x3 != self._x3:
             self._x3 = x3
             verticles = True
-        if y3 is not None:
+        if y3 is not None and y3 != self._y3:
             self._y3 = y3
             verticles = True
 
-        if anchor_x is not None:
+        if anchor_x is not None and anchor_x != self._anchor_x:
             self._anchor_x = anchor_x
             verticles = True
-        if anchor_y is not None:
+        if anchor_y is not None and anchor_y != self._anchor_y:
             self._anchor_y = anchor_y
             verticles = True
 
-        if visible is not None:
+        if visible is not None and visible != self._visible:
             self._visible = visible
             verticles = True
 
@@ -212,18 +319,20 @@ class Triangle(ShapeBase):
             self._update_vertices()
 
 
-        if rotation is not None:
+        if rotation is not None and rotation != self._rotation:
             self.rotation = rotation
 
 
         if color is not None:
             if opacity is not None:
-                self._rgba = (*color[:3], opacity)
+                rgba = (*color[:3], opacity)
             else:
-                self._rgba = (*color[:3], self._rgba[3])
-            self._update_color()
+                rgba = (*color[:3], self._rgba[3])
+            if rgba != self._rgba:
+                self._rgba = rgba
+                self._update_color()
 
-        elif opacity is not None:
+        elif opacity is not None and opacity != self._rgba[3]:
             self._rgba = (*self._rgba[:3], opacity)
             self._update_color()
 
@@ -290,20 +399,66 @@ class Star(ShapeBase):
         self._rgba = r, g, b, a[0] if a else 255
 
         super().__init__(
-            num_spikes * 6,
+            num_spikes * 2 + 1,
             blend_src, blend_dest, batch, group, program,
         )
 
     def __contains__(self, point: tuple[float, float]) -> bool:
         assert len(point) == 2
-        point = _rotate_point((self._x, self._y), point, math.radians(self._rotation))
-        center = (self._x - self._anchor_x, self._y - self._anchor_y)
         radius = (self._outer_radius + self._inner_radius) / 2
+        # The rotation is around the position, so it doesn't change how far away the point is.
+        # Without an anchor, that is also the center; otherwise, it gives a quick rejection.
+        distance = math.dist((self._x, self._y), point)
+        if not (self._anchor_x or self._anchor_y):
+            return distance < radius
+        if distance >= radius + math.hypot(self._anchor_x, self._anchor_y):
+            return False
+        if self._rotation:
+            point = _rotate_point((self._x, self._y), point, math.radians(self._rotation))
+        center = (self._x - self._anchor_x, self._y - self._anchor_y)
         return math.dist(center, point) < radius
 
+    def contains_points(self, points: Iterable[tuple[float, float]]) -> list[bool]:
+        """Test which of many points are inside the star.
+
+        This gives the same results as using ``in`` with each point, but
+        computes the star's rotation and radius only once.
+
+        Args:
+            points:
+                The ``(x, y)`` points to test.
+        """
+        x = self._x
+        y = self._y
+        radius = (self._outer_radius + self._inner_radius) / 2
+        hypot = math.hypot
+        if not (self._anchor_x or self._anchor_y):
+            return [hypot(px - x, py - y) < radius for px, py in points]
+
+        center_x = x - self._anchor_x
+        center_y = y - self._anchor_y
+        reject = radius + hypot(self._anchor_x, self._anchor_y)
+        angle = math.radians(self._rotation)
+        cos = math.cos(angle)
+        sin = math.sin(angle)
+
+        results = []
+        for px, py in points:
+            if hypot(px - x, py - y) >= reject:
+                results.append(False)
+                continue
+            if self._rotation:
+                # Rotate the point around the position, as in _rotate_point.
+                dx = px - x
+                dy = py - y
+                px = x + dx * cos - dy * sin
+                py = y + dx * sin + dy * cos
+            results.append(hypot(px - center_x, py - center_y) < radius)
+        return results
+
     def _create_vertex_list(self) -> None:
-        self._vertex_list = self._program.vertex_list(
-            self._num_verts, self._draw_mode, self._batch, self._group,
+        self._vertex_list = self._program.vertex_list_indexed(
+            self._num_verts, self._draw_mode, _fan_indices(self._num_spikes * 2, True), self._batch, self._group,
             position=('f', self._get_vertices()),
             colors=('Bn', self._rgba * self._num_verts),
             rotation=('f', (self._rotation,) * self._num_verts),
@@ -318,24 +473,14 @@ class Star(ShapeBase):
         r_i = self._inner_radius
         r_o = self._outer_radius
 
-        # get angle covered by each line (= half a spike)
-        d_theta = math.pi / self._num_spikes
-
-        # calculate alternating points on outer and outer circles
-        points = []
-        for i in range(self._num_spikes):
-            points.append((x + (r_o * math.cos(2 * i * d_theta)),
-                           y + (r_o * math.sin(2 * i * d_theta))))
-            points.append((x + (r_i * math.cos((2 * i + 1) * d_theta)),
-                           y + (r_i * math.sin((2 * i + 1) * d_theta))))
-
-        # create a list of doubled-up points from the points
-        vertices = []
-        for i, point in enumerate(points):
-            triangle = x, y, *points[i - 1], *point
-            vertices.extend(triangle)
+        # calculate alternating points on outer and inner circles, each line covering half a spike
+        cos, sin = _unit_ring(self._num_spikes * 2)
+        radii = (r_o, r_i) * self._num_spikes
+        xs = [x + r * c for r, c in zip(radii, cos)]
+        ys = [y + r * s for r, s in zip(radii, sin)]
 
-        return vertices
+        # The center is followed by the outer points, which the indices join into triangles:
+        return [x, y, *chain.from_iterable(zip(xs, ys))]
 
     def _update_vertices(self) -> None:
         self._vertex_list.position[:] = self._get_vertices()
@@ -347,6 +492,8 @@ class Star(ShapeBase):
 
     @outer_radius.setter
     def outer_radius(self, value: float) -> None:
+        if value == self._outer_radius:
+            return
         self._outer_radius = value
         self._update_vertices()
 
@@ -357,6 +504,8 @@ class Star(ShapeBase):
 
     @inner_radius.setter
     def inner_radius(self, value: float) -> None:
+        if value == self._inner_radius:
+            return
         self._inner_radius = value
         self._update_vertices()
 
@@ -367,8 +516,17 @@ class Star(ShapeBase):
 
     @num_spikes.setter
     def num_spikes(self, value: int) -> None:
+        if value == self._num_spikes:
+            return
         self._num_spikes = value
-        self._update_vertices()
+        self._update_num_verts()
+
+    def _update_num_verts(self) -> None:
+        # The number of points changed, so the vertex list is recreated to fit them.
+        self._num_verts = self._num_spikes * 2 + 1
+        self._vertex_list.delete()
+        self._create_vertex_list()
+        self._vertex_list.zposition = (self._z,) * self._num_verts
     
     
     def update(self,
@@ -381,37 +539,37 @@ class Star(ShapeBase):
         translation = False
         verticles = False
         
-        if x is not None:
+        if x is not None and x != self._x:
             self._x = x
             translation = True
-        if y is not None:
+        if y is not None and y != self._y:
             self._y = y
             translation = True
 
         if translation:
             self._update_translation()
 
-        if z is not None:
+        if z is not None and z != self._z:
             self.z = z
         
-        if outer_radius is not None:
+        if outer_radius is not None and outer_radius != self._outer_radius:
             self._outer_radius = outer_radius
             verticles = True
-        if inner_radius is not None:
+        if inner_radius is not None and inner_radius != self._inner_radius:
             self._inner_radius = inner_radius
             verticles = True
-        if num_spikes is not None:
+        if num_spikes is not None and num_spikes != self._num_spikes:
             self._num_spikes = num_spikes
-            verticles = True
+            self._update_num_verts()
 
-        if anchor_x is not None:
+        if anchor_x is not None and anchor_x != self._anchor_x:
             self._anchor_x = anchor_x
             verticles = True
-        if anchor_y is not None:
+        if anchor_y is not None and anchor_y != self._anchor_y:
             self._anchor_y = anchor_y
             verticles = True
 
-        if visible is not None:
+        if visible is not None and visible != self._visible:
             self._visible = visible
             verticles = True
 
@@ -419,18 +577,20 @@ class Star(ShapeBase):
             self._update_vertices()
 
 
-        if rotation is not None:
+        if rotation is not None and rotation != self._rotation:
             self.rotation = rotation
 
 
         if color is not None:
             if opacity is not None:
-                self._rgba = (*color[:3], opacity)
+                rgba = (*color[:3], opacity)
             else:
-                self._rgba = (*color[:3], self._rgba[3])
-            self._update_color()
+                rgba = (*color[:3], self._rgba[3])
+            if rgba != self._rgba:
+                self._rgba = rgba
+                self._update_color()
 
-        elif opacity is not None:
+        elif opacity is not None and opacity != self._rgba[3]:
             self._rgba = (*self._rgba[:3], opacity)
             self._update_color()
 
@@ -474,6 +634,10 @@ class Polygon(ShapeBase):
         self._rotation = 0
         self._coordinates = list(coordinates)
         self._x, self._y = self._coordinates[0]
+        self._bounds = _get_bounds(self._coordinates)
+        # The triangulation only depends on the shape, so it is kept until that changes.
+        self._shape = _get_shape(self._coordinates)
+        self._indices = earcut.earcut(self._shape)
 
         r, g, b, *a = color
         self._rgba = r, g, b, a[0] if a else 255
@@ -484,16 +648,46 @@ class Polygon(ShapeBase):
 
     def __contains__(self, point: tuple[float, float]) -> bool:
         assert len(point) == 2
-        point = _rotate_point(self._coordinates[0], point, math.radians(self._rotation))
-        return _point_in_polygon(self._coordinates + [self._coordinates[0]], point)
+        if self._rotation:
+            point = _rotate_point(self._coordinates[0], point, math.radians(self._rotation))
+        px, py = point
+        min_x, min_y, max_x, max_y = self._bounds
+        if not (min_x <= px <= max_x and min_y <= py <= max_y):
+            return False
+        return _point_in_polygon(self._coordinates, (px, py))
+
+    def contains_points(self, points: Iterable[tuple[float, float]]) -> list[bool]:
+        """Test which of many points are inside the polygon.
+
+        This gives the same results as using ``in`` with each point, but
+        computes the polygon's rotation and edges only once.
+
+        Args:
+            points:
+                The ``(x, y)`` points to test.
+        """
+        if not self._rotation:
+            return _points_in_polygon(self._coordinates, points)
+
+        x, y = self._coordinates[0]
+        angle = math.radians(self._rotation)
+        cos = math.cos(angle)
+        sin = math.sin(angle)
+
+        # Rotate the points around the first vertex, as in _rotate_point.
+        rotated = []
+        for px, py in points:
+            dx = px - x
+            dy = py - y
+            rotated.append((x + dx * cos - dy * sin, y + dx * sin + dy * cos))
+        return _points_in_polygon(self._coordinates, rotated)
 
     def _create_vertex_list(self) -> None:
-        vertices = self._get_vertices()
         self._vertex_list = self._program.vertex_list_indexed(
             self._num_verts, self._draw_mode,
-            earcut.earcut(vertices),
+            self._indices,
             self._batch, self._group,
-            position=('f', vertices),
+            position=('f', self._get_vertices()),
             colors=('Bn', self._rgba * self._num_verts),
             translation=('f', (self._x, self._y) * self._num_verts))
 
@@ -505,10 +699,12 @@ class Polygon(ShapeBase):
         trans_x, trans_y = self._coordinates[0]
         trans_x += self._anchor_x
         trans_y += self._anchor_y
-        coords = [[x - trans_x, y - trans_y] for x, y in self._coordinates]
 
-        # Return the flattened coords.
-        return earcut.flatten([coords])["vertices"]
+        # Flatten the coords as they are adjusted, rather than building a nested list first.
+        vertices = []
+        for x, y in self._coordinates:
+            vertices += (x - trans_x, y - trans_y)
+        return vertices
 
     def _update_vertices(self) -> None:
         self._vertex_list.position[:] = self._get_vertices()
@@ -521,26 +717,44 @@ class Polygon(ShapeBase):
                color: ColorValue | None = None, opacity: float | None = None) -> None:
         verticles = False
         
-        if coordinates is not None:
+        if coordinates is not None and list(coordinates) != self._coordinates:
             x, y =coordinates[0]
             self._x = x
             self._y = y
             self._update_translation()
             
             self._coordinates = list(coordinates)
+            self._bounds = _get_bounds(self._coordinates)
             verticles = True
 
-        if z is not None:
+            shape = _get_shape(self._coordinates)
+            if shape != self._shape:
+                # Moving every point together keeps the triangulation; anything else redoes it.
+                self._shape = shape
+                indices = earcut.earcut(shape)
+                if len(self._coordinates) != self._num_verts or len(indices) != len(self._indices):
+                    self._num_verts = len(self._coordinates)
+                    self._indices = indices
+                    self._vertex_list.delete()
+                    self._create_vertex_list()
+                    self._vertex_list.rotation[:] = (self._rotation,) * self._num_verts
+                    self._vertex_list.zposition = (self._z,) * self._num_verts
+                    verticles = False
+                elif indices != self._indices:
+                    self._indices = indices
+                    self._vertex_list.indices = indices
+
+        if z is not None and z != self._z:
             self.z = z
         
-        if anchor_x is not None:
+        if anchor_x is not None and anchor_x != self._anchor_x:
             self._anchor_x = anchor_x
             verticles = True
-        if anchor_y is not None:
+        if anchor_y is not None and anchor_y != self._anchor_y:
             self._anchor_y = anchor_y
             verticles = True
 
-        if visible is not None:
+        if visible is not None and visible != self._visible:
             self._visible = visible
             verticles = True
 
@@ -548,17 +762,19 @@ class Polygon(ShapeBase):
             self._update_vertices()
 
 
-        if rotation is not None:
+        if rotation is not None and rotation != self._rotation:
             self.rotation = rotation
 
 
         if color is not None:
             if opacity is not None:
-                self._rgba = (*color[:3], opacity)
+                rgba = (*color[:3], opacity)
             else:
-                self._rgba = (*color[:3], self._rgba[3])
-            self._update_color()
+                rgba = (*color[:3], self._rgba[3])
+            if rgba != self._rgba:
+                self._rgba = rgba
+                self._update_color()
 
-        elif opacity is not None:
+        elif opacity is not None and opacity != self._rgba[3]:
             self._rgba = (*self._rgba[:3], opacity)
             self._update_color()
@@ -76,14 +76,12 @@ from kiglent.gl import (
     GL_BLEND,
     GL_ONE_MINUS_SRC_ALPHA,
     GL_SRC_ALPHA,
-    GL_TEXTURE0,
     GL_TRIANGLES,
-    glActiveTexture,
-    glBindTexture,
     glBlendFunc,
     glDisable,
     glEnable,
 )
+from kiglent.graphics.groups import bind_texture, invalidate_state_cache
 
 _is_kiglent_doc_run = hasattr(sys, "is_kiglent_doc_run") and sys.is_kiglent_doc_run
 
@@ -215,8 +213,7 @@ class SpriteGroup(graphics.Group):
     def set_state(self) -> None:
         self.program.use()
 
-        glActiveTexture(GL_TEXTURE0)
-        glBindTexture(self.texture.target, self.texture.id)
+        bind_texture(self.texture.target, self.texture.id)
 
         glEnable(GL_BLEND)
         glBlendFunc(self.blend_src, self.blend_dest)
@@ -844,6 +841,8 @@ class Sprite(event.EventDispatcher):
         See the module documentation for hints on drawing multiple sprites
         efficiently.
         """
+        # Drawing outside a batch, so the state left by earlier drawing is unknown.
+        invalidate_state_cache()
         self._group.set_state_recursive()
         self._vertex_list.draw(GL_TRIANGLES)
         self._group.unset_state_recursive()
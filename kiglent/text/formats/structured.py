@@ -10,13 +10,11 @@ from kiglent.gl import (
     GL_BLEND,
     GL_ONE_MINUS_SRC_ALPHA,
     GL_SRC_ALPHA,
-    GL_TEXTURE0,
-    glActiveTexture,
-    glBindTexture,
     glBlendFunc,
     glDisable,
     glEnable,
 )
+from kiglent.graphics.groups import bind_texture
 
 if TYPE_CHECKING:
     from kiglent.graphics import Group
@@ -37,8 +35,7 @@ class _InlineElementGroup(kiglent.graphics.Group):
     def set_state(self) -> None:
         self.program.use()
 
-        glActiveTexture(GL_TEXTURE0)
-        glBindTexture(self.texture.target, self.texture.id)
+        bind_texture(self.texture.target, self.texture.id)
 
         glEnable(GL_BLEND)
         glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
@@ -24,15 +24,13 @@ from kiglent.gl import (
     GL_NEAREST,
     GL_ONE_MINUS_SRC_ALPHA,
     GL_SRC_ALPHA,
-    GL_TEXTURE0,
     GL_TRIANGLES,
-    glActiveTexture,
-    glBindTexture,
     glBlendFunc,
     glDisable,
     glEnable,
 )
 from kiglent.graphics import Group
+from kiglent.graphics.groups import bind_texture
 from kiglent.text import runlist
 
 if TYPE_CHECKING:
@@ -768,8 +766,7 @@ class TextLayoutGroup(graphics.Group):
         self.program.use()
         self.program["scissor"] = False
 
-        glActiveTexture(GL_TEXTURE0)
-        glBindTexture(self.texture.target, self.texture.id)
+        bind_texture(self.texture.target, self.texture.id)
 
         glEnable(GL_BLEND)
         glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
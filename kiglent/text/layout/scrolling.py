@@ -7,13 +7,11 @@ from kiglent.gl import (
     GL_BLEND,
     GL_ONE_MINUS_SRC_ALPHA,
     GL_SRC_ALPHA,
-    GL_TEXTURE0,
-    glActiveTexture,
-    glBindTexture,
     glBlendFunc,
     glDisable,
     glEnable,
 )
+from kiglent.graphics.groups import bind_texture
 from kiglent.text.layout.base import TextLayout
 
 if TYPE_CHECKING:
@@ -45,8 +43,7 @@ class ScrollableTextLayoutGroup(graphics.Group):
         self.program["scissor"] = True
         self.program["scissor_area"] = self.scissor_area
 
-        glActiveTexture(GL_TEXTURE0)
-        glBindTexture(self.texture.target, self.texture.id)
+        bind_texture(self.texture.target, self.texture.id)
 
         glEnable(GL_BLEND)
         glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
@@ -98,7 +98,7 @@ import kiglent
 from kiglent import gl
 from kiglent.event import EVENT_HANDLE_STATE, EventDispatcher
 from kiglent.graphics import shader
-from kiglent.matrix import Mat4
+from kiglent.matrix import IDENTITY_4, Mat4
 from kiglent.window import key, mouse
 
 if TYPE_CHECKING:
@@ -372,8 +372,8 @@ class BaseWindow(EventDispatcher, metaclass=_WindowMetaclass):
     _screen: Screen | None = None
     _config: DisplayConfig | None = None
     _context: Context | None = None
-    _projection_matrix: Mat4 = Mat4()
-    _view_matrix: Mat4 = Mat4()
+    _projection_matrix: Mat4 = IDENTITY_4
+    _view_matrix: Mat4 = IDENTITY_4
     _viewport: tuple[int, int, int, int] = 0, 0, 0, 0
 
     # Used to restore window size and position after fullscreen
@@ -605,7 +605,7 @@ class BaseWindow(EventDispatcher, metaclass=_WindowMetaclass):
         self._viewport = 0, 0, *self.get_framebuffer_size()
 
         width, height = self.get_size()
-        self.view = Mat4()
+        self.view = IDENTITY_4
         self.projection = Mat4.orthogonal_projection(0, width, 0, height, -8192, 8192)
 
     def __del__(self) -> None:
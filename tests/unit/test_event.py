@@ -0,0 +1,64 @@
+"""Tests for the order in which an EventDispatcher calls its functions and handlers."""
+import unittest
+
+from kiglent.event import EVENT_HANDLED, EventDispatcher, EventHandler
+
+
+class _Dispatcher(EventDispatcher):
+    pass
+
+
+_Dispatcher.register_event_type('on_test')
+
+
+class _Handler(EventHandler):
+    def __init__(self, name, log):
+        self.name = name
+        self.log = log
+
+    def on_test(self):
+        self.log.append(self.name)
+        return EVENT_HANDLED
+
+
+class EventOrderTestCase(unittest.TestCase):
+    def setUp(self):
+        self.log = []
+        self.dispatcher = _Dispatcher()
+
+    def test_remove_handler_pushed_twice(self):
+        first = _Handler('first', self.log)
+        second = _Handler('second', self.log)
+        self.dispatcher.push_handler(first)
+        self.dispatcher.push_handler(second)
+        self.dispatcher.push_handler(first)
+        self.dispatcher.remove_handler(first)
+        self.dispatcher.dispatch_event('on_test')
+        self.assertEqual(self.log, ['second'])
+        self.dispatcher.remove_handler(second)
+        self.dispatcher.dispatch_event('on_test')
+        self.assertEqual(self.log, ['second', 'first'])
+
+    def test_remove_event_added_twice(self):
+        def first():
+            self.log.append('first')
+            return EVENT_HANDLED
+
+        def second():
+            self.log.append('second')
+            return EVENT_HANDLED
+
+        self.dispatcher.add_event('on_test', first)
+        self.dispatcher.add_event('on_test', second)
+        self.dispatcher.add_event('on_test', first)
+        self.dispatcher.remove_event('on_test', first)
+        self.dispatcher.dispatch_event('on_test')
+        self.assertEqual(self.log, ['second'])
+
+    def test_remove_missing_handler(self):
+        with self.assertRaises(ValueError):
+            self.dispatcher.remove_handler(_Handler('missing', self.log))
+
+
+if __name__ == '__main__':
+    unittest.main()
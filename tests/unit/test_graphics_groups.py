@@ -0,0 +1,201 @@
+"""Tests for the state that groups set, and the cache they use to skip redundant state changes.
+
+These draw to a hidden headless window, so they need OpenGL to be available.
+"""
+import unittest
+
+import kiglent
+
+kiglent.options['headless'] = True
+kiglent.options['shadow_window'] = False
+
+from kiglent import graphics, image, sprite  # noqa: E402
+from kiglent.gl import glFinish  # noqa: E402
+
+RED = (255, 0, 0, 255)
+GREEN = (0, 255, 0, 255)
+BLUE = (0, 0, 255, 255)
+
+window = None
+
+
+def setUpModule():
+    global window
+    try:
+        window = kiglent.window.Window(64, 64, visible=False)
+    except Exception as exception:  # noqa: BLE001
+        raise unittest.SkipTest(f'Cannot create a window: {exception}')
+
+
+def tearDownModule():
+    if window is not None:
+        window.close()
+
+
+def _solid_texture(color):
+    return image.ImageData(8, 8, 'RGBA', bytes(color) * 64).get_texture()
+
+
+def _pixel(x, y):
+    glFinish()
+    data = image.get_buffer_manager().get_color_buffer().get_image_data().get_data('RGBA', 64 * 4)
+    offset = (y * 64 + x) * 4
+    return tuple(data[offset:offset + 4])
+
+
+class GroupStateTestCase(unittest.TestCase):
+    def setUp(self):
+        window.switch_to()
+        self.red = _solid_texture(RED)
+        self.green = _solid_texture(GREEN)
+        self.batch = graphics.Batch()
+        self.sprites = [sprite.Sprite(self.red, 0, 0, batch=self.batch),
+                        sprite.Sprite(self.green, 20, 0, batch=self.batch)]
+
+    def assert_sprites_drawn(self):
+        window.clear()
+        self.batch.draw()
+        self.assertEqual(_pixel(4, 4), RED)
+        self.assertEqual(_pixel(24, 4), GREEN)
+
+    def test_sprite_groups_with_different_textures(self):
+        first, second = (s._group for s in self.sprites)
+        self.assertNotEqual(first, second)
+        self.assertFalse(first.equivalent_state(second))
+        self.assertFalse(first.is_compatible_with(second))
+        self.assert_sprites_drawn()
+
+    def test_texture_blit(self):
+        self.assert_sprites_drawn()
+        self.green.blit(40, 40)
+        self.assert_sprites_drawn()
+
+    def test_texture_bind_other_unit(self):
+        self.assert_sprites_drawn()
+        self.green.bind(1)
+        self.assert_sprites_drawn()
+
+    def test_texture_create(self):
+        self.assert_sprites_drawn()
+        _solid_texture(BLUE)
+        self.assert_sprites_drawn()
+
+    def test_visibility_invalidates_own_batch(self):
+        parent = graphics.Group(order=1)
+        hidden = sprite.Sprite(self.red, 40, 0, batch=self.batch, group=parent)
+        other_batch = graphics.Batch()
+        other_sprite = sprite.Sprite(self.green, 40, 20, batch=other_batch)
+        self.batch.draw()
+        other_batch.draw()
+        parent.visible = False
+        self.assertTrue(self.batch._draw_list_dirty)
+        self.assertFalse(other_batch._draw_list_dirty)
+        self.assert_sprites_drawn()
+        self.assertEqual(_pixel(44, 4), (0, 0, 0, 255))
+        hidden.delete()
+        other_sprite.delete()
+
+    def test_sprite_draw(self):
+        window.clear()
+        self.green.bind()
+        self.sprites[0].draw()
+        self.red.bind()
+        self.sprites[1].draw()
+        self.assertEqual(_pixel(4, 4), RED)
+        self.assertEqual(_pixel(24, 4), GREEN)
+
+
+class _NamedGroup(graphics.Group):
+    def __init__(self, name, order=0, parent=None):
+        super().__init__(order, parent)
+        self.name = name
+        self._key = (order, parent, name)
+        self._hash = hash(self._key)
+
+
+class _NameOrderedGroup(_NamedGroup):
+    def __lt__(self, other):
+        return self.name < other.name
+
+
+class _BlendTextureGroup(graphics.TextureGroup):
+    def __init__(self, texture, blend_dest, order=0, parent=None):
+        super().__init__(texture, order, parent)
+        self.blend_dest = blend_dest
+
+    def __eq__(self, other):
+        return super().__eq__(other) and self.blend_dest == other.blend_dest
+
+    def __hash__(self):
+        return hash((self._key, self.blend_dest))
+
+
+class TextureGroupCompatibilityTestCase(unittest.TestCase):
+    def setUp(self):
+        window.switch_to()
+        self.texture = _solid_texture(RED)
+
+    def test_same_texture_different_order(self):
+        first = graphics.TextureGroup(self.texture, order=0)
+        second = graphics.TextureGroup(self.texture, order=1)
+        self.assertTrue(first.is_compatible_with(second))
+
+    def test_subclass_with_more_state(self):
+        first = _BlendTextureGroup(self.texture, 1)
+        second = _BlendTextureGroup(self.texture, 2)
+        self.assertFalse(first.is_compatible_with(second))
+        self.assertTrue(first.is_compatible_with(_BlendTextureGroup(self.texture, 1)))
+
+
+class GroupSortTestCase(unittest.TestCase):
+    def sorted_top_groups(self, groups):
+        batch = graphics.Batch()
+        for group in groups:
+            batch._add_group(group)
+        batch._update_draw_list()
+        return batch.top_groups
+
+    def test_equal_keys_keep_insertion_order(self):
+        groups = [_NamedGroup(name) for name in 'bac']
+        self.assertEqual(self.sorted_top_groups(groups), groups)
+
+    def test_order_before_insertion_order(self):
+        groups = [_NamedGroup('a', order=1), _NamedGroup('b', order=2), _NamedGroup('c', order=1)]
+        self.assertEqual(self.sorted_top_groups(groups), [groups[1], groups[0], groups[2]])
+
+    def test_lt_override(self):
+        groups = [_NameOrderedGroup(name) for name in 'bac']
+        self.assertEqual([group.name for group in self.sorted_top_groups(groups)], ['c', 'b', 'a'])
+
+
+class _RecordingGroup(_NamedGroup):
+    def __init__(self, name, log, order=0, parent=None):
+        super().__init__(name, order, parent)
+        self.log = log
+
+    def set_state(self):
+        self.log.append(self.name)
+
+
+class GroupParentTestCase(unittest.TestCase):
+    def test_reassign_parent(self):
+        parent = graphics.Group()
+        group = graphics.Group()
+        group.parent = parent
+        self.assertIs(group.parent, parent)
+        self.assertEqual(group, graphics.Group(parent=parent))
+        self.assertEqual(hash(group), hash(graphics.Group(parent=parent)))
+
+    def test_reassign_parent_of_ancestor(self):
+        log = []
+        root = _RecordingGroup('root', log)
+        middle = _RecordingGroup('middle', log)
+        leaf = _RecordingGroup('leaf', log, parent=middle)
+        leaf.set_state_recursive()
+        middle.parent = root
+        leaf.set_state_recursive()
+        self.assertEqual(log, ['middle', 'leaf', 'root', 'middle', 'leaf'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+"""Tests for the Mat4 transformations."""
+import unittest
+
+from kiglent.matrix import Mat4, Vec3
+
+
+class Mat4ScaleTestCase(unittest.TestCase):
+    def setUp(self):
+        self.matrix = Mat4.from_rotation(0.5, Vec3(0.0, 0.0, 1.0)).translate(Vec3(1.0, 2.0, 3.0))
+        self.vector = Vec3(2.0, 3.0, 4.0)
+
+    def assert_matrix_equal(self, first, second):
+        for a, b in zip(first, second):
+            self.assertAlmostEqual(a, b)
+
+    def test_scale_diagonal(self):
+        scaled = list(self.matrix)
+        scaled[0] *= 2.0
+        scaled[5] *= 3.0
+        scaled[10] *= 4.0
+        self.assertEqual(self.matrix.scale(self.vector), Mat4(*scaled))
+
+    def test_scale_columns(self):
+        self.assert_matrix_equal(self.matrix.scale_columns(self.vector),
+                                 self.matrix @ Mat4.from_scale(self.vector))
+
+    def test_scale_columns_unrotated(self):
+        matrix = Mat4().translate(Vec3(1.0, 2.0, 3.0))
+        self.assertEqual(matrix.scale_columns(self.vector), matrix.scale(self.vector))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+"""Tests for updating a Circle's properties.
+
+These create vertex lists in a hidden headless window, so they need OpenGL to be available.
+"""
+import unittest
+
+import kiglent
+
+kiglent.options['headless'] = True
+kiglent.options['shadow_window'] = False
+
+from kiglent import shapes  # noqa: E402
+
+window = None
+
+
+def setUpModule():
+    global window
+    try:
+        window = kiglent.window.Window(64, 64, visible=False)
+    except Exception as exception:  # noqa: BLE001
+        raise unittest.SkipTest(f'Cannot create a window: {exception}')
+
+
+def tearDownModule():
+    if window is not None:
+        window.close()
+
+
+class CircleTestCase(unittest.TestCase):
+    def setUp(self):
+        window.switch_to()
+        self.circle = shapes.Circle(10, 10, 5, color=(255, 0, 0))
+
+    def tearDown(self):
+        self.circle.delete()
+
+    def test_update(self):
+        self.circle.update(radius=7, rotation=30, color=(0, 255, 0), opacity=100)
+        self.assertEqual((self.circle.a, self.circle.b), (7, 7))
+        self.assertEqual(self.circle.rotation, 30)
+        self.assertEqual(self.circle.color, (0, 255, 0, 100))
+
+    def test_update_opacity(self):
+        self.circle.update(opacity=50)
+        self.assertEqual(self.circle.color, (255, 0, 0, 50))
+
+    def test_axes(self):
+        self.circle.a = 3
+        self.assertEqual((self.circle.radius, self.circle.b), (3, 3))
+        self.circle.b = 4
+        self.assertEqual((self.circle.radius, self.circle.a), (4, 4))
+
+
+if __name__ == '__main__':
+    unittest.main()